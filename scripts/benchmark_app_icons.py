@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Zoe Sleep App Icon Benchmark
+
+Times each stage of the icon rendering pipeline (gradient, flow lines,
+glowing wave, energy orb, blur, quantization, PNG encoding) and the full
+create_zoe_sleep_icon render (single-threaded and with one thread per
+core) across the sizes declared in the asset catalogs. Results are
+written as JSON and can be compared against a stored baseline so
+rendering regressions show up in CI.
+
+Usage:
+    python3 scripts/benchmark_app_icons.py
+    python3 scripts/benchmark_app_icons.py --sizes 120,512,1024 --repeat 5
+    python3 scripts/benchmark_app_icons.py --save-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from generate_app_icons import (
+    Canvas,
+    blur_layer,
+    build_targets,
+    create_zoe_sleep_icon,
+    encode_png,
+    energy_orb_layer,
+    flow_lines_layer,
+    gradient_layer,
+    main_wave_layer,
+)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+DEFAULT_BASELINE = os.path.join(SCRIPT_DIR, 'icon_benchmark_baseline.json')
+THREADS = os.cpu_count() or 1
+
+
+def _background(size):
+    canvas = Canvas(size)
+    gradient_layer(canvas)
+    return (canvas,)
+
+
+def _quantize(canvas):
+    return canvas.to_image()
+
+
+# (name, minimum size at which the stage runs, setup(size) -> args, stage(*args))
+STAGES = [
+    ('gradient', 0, lambda size: (Canvas(size),), gradient_layer),
+    ('flow_lines', 60, _background, flow_lines_layer),
+    ('main_wave', 40, _background, main_wave_layer),
+    ('energy_orb', 100, _background, energy_orb_layer),
+    ('blur', 120, _background, blur_layer),
+    ('quantize', 0, _background, _quantize),
+    ('png_encode', 0, lambda size: (create_zoe_sleep_icon(size),), encode_png),
+    ('full_icon', 0, lambda size: (size,), create_zoe_sleep_icon),
+    ('full_icon_threaded', 0, lambda size: (size, None, THREADS), create_zoe_sleep_icon),
+]
+
+
+def measure(setup, stage, size, repeat):
+    """Run one stage and return its timing and memory statistics.
+
+    Wall time is measured without tracing. A separate traced run records
+    the peak traced memory, which includes temporaries freed before the
+    stage returned, and the bytes and blocks still held when it returned
+    (net retained, not the number of allocations made). tracemalloc only
+    sees Python and numpy allocations, not Pillow's internal image buffers.
+    """
+    timings = []
+    for _ in range(repeat):
+        args = setup(size)
+        start = time.perf_counter()
+        stage(*args)
+        timings.append(time.perf_counter() - start)
+
+    args = setup(size)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = stage(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+
+    diffs = after.compare_to(before, 'filename')
+    return {
+        'min_s': min(timings),
+        'median_s': statistics.median(timings),
+        'peak_bytes': peak,
+        'retained_bytes': sum(diff.size_diff for diff in diffs),
+        'retained_blocks': sum(diff.count_diff for diff in diffs),
+    }
+
+
+def run_benchmarks(sizes, repeat):
+    """Benchmark every applicable stage at every size."""
+    results = []
+    for size in sizes:
+        print(f"\n{size}x{size}")
+        for name, min_size, setup, stage in STAGES:
+            if size < min_size:
+                continue
+            stats = measure(setup, stage, size, repeat)
+            results.append({'stage': name, 'size': size, **stats})
+            print(f"  {name:<18} {stats['median_s'] * 1000:9.2f} ms  "
+                  f"peak {stats['peak_bytes'] / 1024:9.1f} KiB  "
+                  f"retained {stats['retained_bytes'] / 1024:9.1f} KiB in {stats['retained_blocks']:6d} blocks")
+    return results
+
+
+def compare_to_baseline(results, baseline, threshold):
+    """Return (stage, size, baseline_s, current_s) for every regression."""
+    previous = {(r['stage'], r['size']): r for r in baseline.get('results', [])}
+    regressions = []
+    for result in results:
+        base = previous.get((result['stage'], result['size']))
+        if not base:
+            continue
+        if result['median_s'] > base['median_s'] * (1 + threshold):
+            regressions.append((result['stage'], result['size'], base['median_s'], result['median_s']))
+    return regressions
+
+
+def catalog_sizes():
+    """Return the distinct pixel sizes declared by the asset catalogs."""
+    sizes = set()
+    for _, _, entries in build_targets(PROJECT_ROOT):
+        sizes.update(pixel_size for _, _, _, pixel_size in entries)
+    return sorted(sizes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Zoe Sleep icon renderer")
+    parser.add_argument('--sizes', help="comma-separated pixel sizes (default: every catalog size)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per stage (default: 3)")
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help=f"baseline results to compare against (default: {DEFAULT_BASELINE})")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="store these results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="relative slowdown reported as a regression (default: 0.2)")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',')] if args.sizes else catalog_sizes()
+
+    print("=" * 60)
+    print("Zoe Sleep App Icon Benchmark")
+    print("=" * 60)
+    print(f"Sizes: {', '.join(map(str, sizes))}")
+    print(f"Repeats: {args.repeat}")
+
+    results = run_benchmarks(sizes, args.repeat)
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'repeat': args.repeat,
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Saved results to: {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Saved baseline to: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("\nNo baseline found - run with --save-baseline to create one")
+        return
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+
+    print("\n" + "=" * 60)
+    if not regressions:
+        print(f"No regressions against baseline from {baseline.get('created_at', 'unknown')}")
+        return
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+    for stage, size, before, after in regressions:
+        print(f"  ✗ {stage} @ {size}px: {before * 1000:.2f} ms -> {after * 1000:.2f} ms")
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,13 +4,30 @@ Script to fetch all main components and tasks from Linear
 """
 import sys
 import os
+import re
 import json
+import sqlite3
+import time
+import asyncio
+import argparse
 from datetime import datetime
 
 # Add parent directory to path to import linear_client
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from linear_client import LinearClient
+from linear_transport import PooledLinearClient
+from linear_query_cache import QueryCache
+from linear_async import DEFAULT_CONCURRENCY, AsyncLinearClient
+from linear_cache import DEFAULT_CACHE_PATH, IssueCache, sync_project_issues
+from linear_issues import (
+    get_project,
+    index_issues,
+    iter_project_issues,
+    page_size_setting,
+    partition_issues_by_component,
+)
+
+DEFAULT_PROJECT_NAME = "ZOE scope"
 
 def format_date(date_str):
     """Format ISO date string to readable format"""
@@ -22,64 +39,320 @@ def format_date(date_str):
     except:
         return date_str
 
-def get_all_issues_for_component(client, project, component_title):
-    """Get all issues that belong to a component"""
-    all_issues = project.get("issues", [])
-    component_issues = []
-    
-    # Extract component prefix (e.g., "Component 1" from "Component 1: Title")
-    component_prefix = None
-    if ":" in component_title:
-        component_prefix = component_title.split(":")[0].strip()
-    else:
-        import re
-        match = re.match(r"(Component\s+\d+)", component_title)
-        if match:
-            component_prefix = match.group(1)
-    
-    for issue in all_issues:
-        issue_title = issue.get("title", "")
-        # Check if issue belongs to this component
-        if component_prefix and component_prefix in issue_title:
-            component_issues.append(issue)
-        # Also check if it's a child of the component issue
-        parent = issue.get("parent", {})
-        if parent and component_prefix and component_prefix in parent.get("title", ""):
-            component_issues.append(issue)
-    
-    return component_issues
+def report_progress(issues, every):
+    """Pass issues through, printing a running count every `every` issues"""
+    for count, issue in enumerate(issues, 1):
+        yield issue
+        if count % every == 0:
+            print(f"   ... {count} issues so far")
+
+def fetch_all_linear_data(sync=False, full_sync=False, cache_path=DEFAULT_CACHE_PATH, refresh=False,
+                          export_format="full", sqlite=False):
+    """Fetch all components and tasks from Linear
 
-def fetch_all_linear_data():
-    """Fetch all components and tasks from Linear"""
+    With sync, only issues changed since the last run are fetched into the
+    local SQLite cache and the exports are built from the cache; full_sync
+    rebuilds the cache from scratch. refresh re-queries the usually cached
+    component list instead of reusing it.
+    """
     # Initialize client with API key
     api_key = os.getenv("LINEAR_API_KEY", "your-linear-api-key-here")
-    client = LinearClient(api_key)
+    client = PooledLinearClient(api_key, cache=QueryCache(), bypass_cache=refresh)
     
-    project_name = "ZOE scope"
+    project_name = DEFAULT_PROJECT_NAME
     
     print("="*80)
     print(f"Fetching Linear data from project: {project_name}")
     print("="*80)
     
-    # Get the full project with all issues
+    # Get the project, then page through its issues
     print("\n1. Fetching project and all issues...")
-    project = client.get_project_with_issues(project_name)
+    project = get_project(client, project_name)
     
     if not project:
         print(f"ERROR: Project '{project_name}' not found!")
         return
     
-    all_issues = project.get("issues", [])
+    page_size = page_size_setting()
+    if sync or full_sync:
+        cache = IssueCache(cache_path)
+        fetched = sync_project_issues(client, cache, project["id"], page_size, full=full_sync)
+        print(f"   ✓ Synced {fetched} new or updated issues into {os.path.normpath(cache.path)}")
+        all_issues, issues_by_identifier, children_by_parent = index_issues(cache.iter_issues(project["id"]))
+        cache.close()
+    else:
+        issues = iter_project_issues(client, project["id"], page_size)
+        all_issues, issues_by_identifier, children_by_parent = index_issues(report_progress(issues, page_size))
     print(f"   ✓ Found {len(all_issues)} total issues")
     
+    parent_categories = client.get_parent_categories(project_name)
+    export_linear_data(project_name, project, all_issues, issues_by_identifier, children_by_parent, parent_categories,
+                       export_format=export_format, sqlite=sqlite)
+
+EXPORT_FORMATS = ["full", "normalized", "jsonl"]
+
+def task_record(issue):
+    """Extract the fields the full export lists for a component task"""
+    return {
+        "identifier": issue.get("identifier"),
+        "title": issue.get("title"),
+        "description": issue.get("description"),
+        "state": {
+            "name": issue.get("state", {}).get("name"),
+            "type": issue.get("state", {}).get("type")
+        },
+        "priority": issue.get("priority"),
+        "assignee": {
+            "name": issue.get("assignee", {}).get("name"),
+            "email": issue.get("assignee", {}).get("email")
+        } if issue.get("assignee") else None,
+        "creator": {
+            "name": issue.get("creator", {}).get("name"),
+            "email": issue.get("creator", {}).get("email")
+        } if issue.get("creator") else None,
+        "parent": {
+            "identifier": issue.get("parent", {}).get("identifier"),
+            "title": issue.get("parent", {}).get("title")
+        } if issue.get("parent") else None,
+        "children_count": len(issue.get("children", {}).get("nodes", [])),
+        "created_at": issue.get("createdAt"),
+        "updated_at": issue.get("updatedAt"),
+        "full_issue": issue
+    }
+
+def other_task_record(issue):
+    """Extract the fields the full export lists for a task outside any component"""
+    return {
+        "identifier": issue.get("identifier"),
+        "title": issue.get("title"),
+        "description": issue.get("description"),
+        "state": {
+            "name": issue.get("state", {}).get("name"),
+            "type": issue.get("state", {}).get("type")
+        },
+        "priority": issue.get("priority"),
+        "assignee": {
+            "name": issue.get("assignee", {}).get("name"),
+            "email": issue.get("assignee", {}).get("email")
+        } if issue.get("assignee") else None,
+        "created_at": issue.get("createdAt"),
+        "updated_at": issue.get("updatedAt")
+    }
+
+def component_summary(component_info, issue_count):
+    """Component fields shared by every export format"""
+    return {
+        "identifier": component_info.get("identifier"),
+        "title": component_info.get("title"),
+        "state": component_info.get("state"),
+        "priority": component_info.get("priority"),
+        "children_count": issue_count
+    }
+
+def write_full_export(f, project_data, groups, other_tasks):
+    """Write the original nested export, with every issue copied in full"""
+    components_data = []
+    for component_info, component_issue, tasks, unique_count in groups:
+        component = component_summary(component_info, unique_count)
+        component["full_issue"] = component_issue
+        components_data.append({
+            "component": component,
+            "tasks": [task_record(issue) for issue in tasks]
+        })
+    output_data = {
+        "project": project_data,
+        "components": components_data,
+        "other_tasks": [other_task_record(issue) for issue in other_tasks]
+    }
+    json.dump(output_data, f, indent=2, ensure_ascii=False)
+
+def write_normalized_export(f, project_data, groups, other_tasks, all_issues):
+    """Write each issue once, keyed by identifier, with components referring to them
+
+    Records are written one at a time, so the export never exists as a
+    single in-memory tree.
+    """
+    def dumps(value):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+    f.write('{\n"format":"normalized",\n"project":' + dumps(project_data) + ',\n"components":[')
+    for i, (component_info, component_issue, tasks, unique_count) in enumerate(groups):
+        component = component_summary(component_info, unique_count)
+        component["issue"] = component_issue.get("identifier") if component_issue else None
+        component["tasks"] = [issue.get("identifier") for issue in tasks]
+        f.write(("," if i else "") + "\n" + dumps(component))
+    f.write('\n],\n"other_tasks":' + dumps([issue.get("identifier") for issue in other_tasks]))
+    f.write(',\n"issues":{')
+    first = True
+    for issue in all_issues:
+        if not issue.get("identifier"):
+            continue
+        f.write(("" if first else ",") + "\n" + dumps(issue["identifier"]) + ":" + dumps(issue))
+        first = False
+    f.write("\n}\n}\n")
+
+def write_jsonl_export(f, project_data, groups, other_tasks, all_issues):
+    """Write one compact JSON record per line for streaming consumers
+
+    The project comes first, then one record per component (tasks as
+    identifiers), the identifiers of tasks outside any component, and
+    finally every issue once.
+    """
+    def write(record):
+        f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    write({"record": "project", **project_data})
+    for component_info, component_issue, tasks, unique_count in groups:
+        component = component_summary(component_info, unique_count)
+        write({
+            "record": "component",
+            **component,
+            "issue": component_issue.get("identifier") if component_issue else None,
+            "tasks": [issue.get("identifier") for issue in tasks]
+        })
+    write({"record": "other_tasks", "tasks": [issue.get("identifier") for issue in other_tasks]})
+    for issue in all_issues:
+        write({"record": "issue", **issue})
+
+SQLITE_SCHEMA = """
+CREATE TABLE project (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    description TEXT,
+    state TEXT,
+    progress REAL,
+    total_issues INTEGER,
+    fetched_at TEXT
+);
+CREATE TABLE states (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    type TEXT
+);
+CREATE TABLE assignees (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    email TEXT
+);
+CREATE TABLE issues (
+    id TEXT PRIMARY KEY,
+    identifier TEXT UNIQUE,
+    title TEXT,
+    description TEXT,
+    priority INTEGER,
+    state_id TEXT REFERENCES states (id),
+    assignee_id TEXT REFERENCES assignees (id),
+    creator_id TEXT REFERENCES assignees (id),
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE TABLE components (
+    identifier TEXT PRIMARY KEY,
+    title TEXT,
+    state TEXT,
+    priority INTEGER,
+    children_count INTEGER,
+    issue_id TEXT REFERENCES issues (id)
+);
+CREATE TABLE component_tasks (
+    component TEXT NOT NULL REFERENCES components (identifier),
+    issue_id TEXT NOT NULL REFERENCES issues (id),
+    PRIMARY KEY (component, issue_id)
+);
+CREATE TABLE parent_edges (
+    parent_id TEXT NOT NULL,
+    child_id TEXT PRIMARY KEY REFERENCES issues (id)
+);
+CREATE INDEX issues_state ON issues (state_id);
+CREATE INDEX issues_assignee ON issues (assignee_id);
+CREATE INDEX component_tasks_issue ON component_tasks (issue_id);
+CREATE INDEX parent_edges_parent ON parent_edges (parent_id);
+CREATE VIEW other_tasks AS
+    SELECT issues.* FROM issues
+    WHERE id NOT IN (SELECT issue_id FROM component_tasks)
+      AND id NOT IN (SELECT issue_id FROM components WHERE issue_id IS NOT NULL);
+"""
+
+def write_sqlite_export(sqlite_file, project_data, groups, all_issues):
+    """Write the export as an indexed SQLite database
+
+    Issues reference their state and assignee rows; component membership
+    and parent links are edge tables, and the other_tasks view lists
+    issues outside every component. Typical questions stay in SQL, e.g.
+    open tasks per component per assignee:
+
+        SELECT ct.component, a.name, COUNT(*) FROM component_tasks ct
+        JOIN issues i ON i.id = ct.issue_id
+        JOIN states s ON s.id = i.state_id
+        LEFT JOIN assignees a ON a.id = i.assignee_id
+        WHERE s.type NOT IN ('completed', 'canceled')
+        GROUP BY ct.component, a.name
+
+    The database is built next to the target and moved into place, so
+    readers never see a half-written file.
+    """
+    temp_file = sqlite_file + ".tmp"
+    if os.path.exists(temp_file):
+        os.remove(temp_file)
+    db = sqlite3.connect(temp_file)
+    db.executescript(SQLITE_SCHEMA)
+    
+    def ref_id(ref):
+        return ref.get("id") or ref.get("email") or ref.get("name") if ref else None
+    
+    with db:
+        db.execute("INSERT INTO project VALUES (?, ?, ?, ?, ?, ?, ?)", (
+            project_data["id"], project_data["name"], project_data["description"], project_data["state"],
+            project_data["progress"], project_data["total_issues"], project_data["fetched_at"]
+        ))
+        for issue in all_issues:
+            state = issue.get("state") or {}
+            if ref_id(state):
+                db.execute("INSERT OR IGNORE INTO states VALUES (?, ?, ?)",
+                           (ref_id(state), state.get("name"), state.get("type")))
+            for person in (issue.get("assignee"), issue.get("creator")):
+                if ref_id(person):
+                    db.execute("INSERT OR IGNORE INTO assignees VALUES (?, ?, ?)",
+                               (ref_id(person), person.get("name"), person.get("email")))
+            db.execute("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", (
+                issue.get("id"), issue.get("identifier"), issue.get("title"), issue.get("description"),
+                issue.get("priority"), ref_id(state), ref_id(issue.get("assignee")),
+                ref_id(issue.get("creator")), issue.get("createdAt"), issue.get("updatedAt")
+            ))
+            parent = issue.get("parent")
+            if parent and parent.get("id"):
+                db.execute("INSERT OR REPLACE INTO parent_edges VALUES (?, ?)", (parent["id"], issue.get("id")))
+        for component_info, component_issue, tasks, unique_count in groups:
+            component = component_summary(component_info, unique_count)
+            db.execute("INSERT OR REPLACE INTO components VALUES (?, ?, ?, ?, ?, ?)", (
+                component["identifier"], component["title"], component["state"], component["priority"],
+                component["children_count"], component_issue.get("id") if component_issue else None
+            ))
+            db.executemany("INSERT OR IGNORE INTO component_tasks VALUES (?, ?)",
+                           [(component["identifier"], issue.get("id")) for issue in tasks])
+    db.execute("ANALYZE")
+    db.close()
+    os.replace(temp_file, sqlite_file)
+
+def export_linear_data(project_name, project, all_issues, issues_by_identifier, children_by_parent,
+                       parent_categories, output_name="linear_data", export_format="full", sqlite=False):
+    """Group a project's issues by component and write the data and Markdown exports
+
+    export_format picks the data file: "full" is the original nested
+    linear_data.json, "normalized" stores every issue once keyed by
+    identifier with components referencing them, and "jsonl" writes the
+    normalized records to linear_data.jsonl, one per line. sqlite also
+    writes the same data to an indexed linear_data.sqlite for queries.
+    """
     # Get main components
     print("\n2. Identifying main components...")
-    parent_categories = client.get_parent_categories(project_name)
     main_components = [c for c in parent_categories if c.get("type") == "component"]
     print(f"   ✓ Found {len(main_components)} main components")
+    issues_by_component = partition_issues_by_component(all_issues, main_components)
     
-    # Structure the data
-    components_data = []
+    # Group the issues: (component info, component issue, tasks, issue count)
+    groups = []
+    component_task_identifiers = set()
     
     for component_info in main_components:
         component_id = component_info.get("identifier")
@@ -88,180 +361,93 @@ def fetch_all_linear_data():
         print(f"\n3. Processing component: {component_id} - {component_title}")
         
         # Find the main component issue
-        main_component_issue = None
-        for issue in all_issues:
-            if issue.get("identifier") == component_id:
-                main_component_issue = issue
-                break
-        
-        # Get all issues for this component
-        component_issues = get_all_issues_for_component(client, project, component_title)
+        main_component_issue = issues_by_identifier.get(component_id)
         
-        # Also get explicit children
-        if main_component_issue:
-            explicit_children = main_component_issue.get("children", {}).get("nodes", [])
-            # Merge with component issues
-            child_ids = {issue.get("identifier") for issue in component_issues}
-            for child in explicit_children:
-                if child.get("identifier") not in child_ids:
-                    # Find full issue data
-                    for issue in all_issues:
-                        if issue.get("identifier") == child.get("identifier"):
-                            component_issues.append(issue)
-                            break
-        
-        # Remove duplicates based on identifier
-        seen = set()
-        unique_issues = []
-        for issue in component_issues:
-            issue_id = issue.get("identifier")
-            if issue_id and issue_id not in seen:
-                seen.add(issue_id)
-                unique_issues.append(issue)
+        # Get all issues for this component, plus its explicit children,
+        # keyed by identifier to drop duplicates
+        component_issues = issues_by_component[component_id] + children_by_parent.get(component_id, [])
+        unique_issues = list({
+            issue["identifier"]: issue for issue in component_issues if issue.get("identifier")
+        }.values())
         
         # Sort issues by identifier
         unique_issues.sort(key=lambda x: x.get("identifier", ""))
         
         print(f"   ✓ Found {len(unique_issues)} tasks/issues")
         
-        component_data = {
-            "component": {
-                "identifier": component_id,
-                "title": component_title,
-                "state": component_info.get("state"),
-                "priority": component_info.get("priority"),
-                "children_count": len(unique_issues),
-                "full_issue": main_component_issue
-            },
-            "tasks": []
-        }
-        
-        # Process each task
-        for issue in unique_issues:
-            # Skip the main component issue itself
-            if issue.get("identifier") == component_id:
-                continue
-                
-            task_data = {
-                "identifier": issue.get("identifier"),
-                "title": issue.get("title"),
-                "description": issue.get("description"),
-                "state": {
-                    "name": issue.get("state", {}).get("name"),
-                    "type": issue.get("state", {}).get("type")
-                },
-                "priority": issue.get("priority"),
-                "assignee": {
-                    "name": issue.get("assignee", {}).get("name"),
-                    "email": issue.get("assignee", {}).get("email")
-                } if issue.get("assignee") else None,
-                "creator": {
-                    "name": issue.get("creator", {}).get("name"),
-                    "email": issue.get("creator", {}).get("email")
-                } if issue.get("creator") else None,
-                "parent": {
-                    "identifier": issue.get("parent", {}).get("identifier"),
-                    "title": issue.get("parent", {}).get("title")
-                } if issue.get("parent") else None,
-                "children_count": len(issue.get("children", {}).get("nodes", [])),
-                "created_at": issue.get("createdAt"),
-                "updated_at": issue.get("updatedAt"),
-                "full_issue": issue
-            }
-            
-            component_data["tasks"].append(task_data)
-        
-        components_data.append(component_data)
+        # Skip the main component issue itself
+        tasks = [issue for issue in unique_issues if issue.get("identifier") != component_id]
+        groups.append((component_info, main_component_issue, tasks, len(unique_issues)))
+        component_task_identifiers.add(component_id)
+        component_task_identifiers.update(issue.get("identifier") for issue in tasks)
     
     # Get all other tasks not in components
     print("\n4. Finding tasks not assigned to components...")
-    component_identifiers = {c["component"]["identifier"] for c in components_data}
-    component_task_identifiers = set()
-    for comp_data in components_data:
-        component_task_identifiers.add(comp_data["component"]["identifier"])
-        for task in comp_data["tasks"]:
-            component_task_identifiers.add(task["identifier"])
-    
-    other_tasks = []
-    for issue in all_issues:
-        if issue.get("identifier") not in component_task_identifiers:
-            other_tasks.append(issue)
-    
+    other_tasks = [issue for issue in all_issues if issue.get("identifier") not in component_task_identifiers]
     print(f"   ✓ Found {len(other_tasks)} tasks not in components")
     
-    # Create final data structure
-    output_data = {
-        "project": {
-            "name": project_name,
-            "id": project.get("id"),
-            "description": project.get("description"),
-            "state": project.get("state"),
-            "progress": project.get("progress"),
-            "total_issues": len(all_issues),
-            "fetched_at": datetime.now().isoformat()
-        },
-        "components": components_data,
-        "other_tasks": [
-            {
-                "identifier": issue.get("identifier"),
-                "title": issue.get("title"),
-                "description": issue.get("description"),
-                "state": {
-                    "name": issue.get("state", {}).get("name"),
-                    "type": issue.get("state", {}).get("type")
-                },
-                "priority": issue.get("priority"),
-                "assignee": {
-                    "name": issue.get("assignee", {}).get("name"),
-                    "email": issue.get("assignee", {}).get("email")
-                } if issue.get("assignee") else None,
-                "created_at": issue.get("createdAt"),
-                "updated_at": issue.get("updatedAt")
-            }
-            for issue in other_tasks
-        ]
+    project_data = {
+        "name": project_name,
+        "id": project.get("id"),
+        "description": project.get("description"),
+        "state": project.get("state"),
+        "progress": project.get("progress"),
+        "total_issues": len(all_issues),
+        "fetched_at": datetime.now().isoformat()
     }
     
-    # Save to JSON file
-    json_file = os.path.join(os.path.dirname(__file__), "..", "data", "linear_data.json")
+    # Save the data file
+    extension = "jsonl" if export_format == "jsonl" else "json"
+    json_file = os.path.join(os.path.dirname(__file__), "..", "data", f"{output_name}.{extension}")
     os.makedirs(os.path.dirname(json_file), exist_ok=True)
     
     with open(json_file, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+        if export_format == "normalized":
+            write_normalized_export(f, project_data, groups, other_tasks, all_issues)
+        elif export_format == "jsonl":
+            write_jsonl_export(f, project_data, groups, other_tasks, all_issues)
+        else:
+            write_full_export(f, project_data, groups, other_tasks)
     
-    print(f"\n✓ Saved JSON data to: {json_file}")
+    print(f"\n✓ Saved {export_format} data to: {json_file}")
+    
+    sqlite_file = None
+    if sqlite:
+        sqlite_file = os.path.join(os.path.dirname(__file__), "..", "data", f"{output_name}.sqlite")
+        write_sqlite_export(sqlite_file, project_data, groups, all_issues)
+        print(f"✓ Saved SQLite database to: {sqlite_file}")
     
     # Create markdown summary
-    md_file = os.path.join(os.path.dirname(__file__), "..", "data", "linear_data.md")
+    md_file = os.path.join(os.path.dirname(__file__), "..", "data", f"{output_name}.md")
     with open(md_file, "w", encoding="utf-8") as f:
         f.write(f"# Linear Data Export\n\n")
         f.write(f"**Project:** {project_name}\n")
-        f.write(f"**Fetched:** {format_date(output_data['project']['fetched_at'])}\n")
+        f.write(f"**Fetched:** {format_date(project_data['fetched_at'])}\n")
         f.write(f"**Total Issues:** {len(all_issues)}\n")
-        f.write(f"**Main Components:** {len(components_data)}\n\n")
+        f.write(f"**Main Components:** {len(groups)}\n\n")
         
         f.write("---\n\n")
         f.write("## Main Components\n\n")
         
-        for comp_data in components_data:
-            comp = comp_data["component"]
-            f.write(f"### {comp['identifier']}: {comp['title']}\n\n")
-            f.write(f"- **State:** {comp['state']}\n")
-            f.write(f"- **Priority:** {comp['priority']}\n")
-            f.write(f"- **Tasks:** {len(comp_data['tasks'])}\n\n")
+        for component_info, _, tasks, _ in groups:
+            f.write(f"### {component_info.get('identifier')}: {component_info.get('title')}\n\n")
+            f.write(f"- **State:** {component_info.get('state')}\n")
+            f.write(f"- **Priority:** {component_info.get('priority')}\n")
+            f.write(f"- **Tasks:** {len(tasks)}\n\n")
             
-            if comp_data["tasks"]:
+            if tasks:
                 f.write("#### Tasks\n\n")
-                for task in comp_data["tasks"]:
-                    f.write(f"- **{task['identifier']}** - {task['title']}\n")
-                    f.write(f"  - State: {task['state']['name']} ({task['state']['type']})\n")
-                    if task['priority']:
+                for task in tasks:
+                    state = task.get("state", {})
+                    f.write(f"- **{task.get('identifier')}** - {task.get('title')}\n")
+                    f.write(f"  - State: {state.get('name')} ({state.get('type')})\n")
+                    if task.get('priority'):
                         f.write(f"  - Priority: {task['priority']}\n")
-                    if task['assignee']:
-                        f.write(f"  - Assignee: {task['assignee']['name']}\n")
-                    if task['parent']:
-                        f.write(f"  - Parent: {task['parent']['identifier']}\n")
-                    if task['description']:
+                    if task.get('assignee'):
+                        f.write(f"  - Assignee: {task['assignee'].get('name')}\n")
+                    if task.get('parent'):
+                        f.write(f"  - Parent: {task['parent'].get('identifier')}\n")
+                    if task.get('description'):
                         desc = task['description'][:200].replace('\n', ' ')
                         f.write(f"  - Description: {desc}...\n")
                     f.write("\n")
@@ -284,15 +470,106 @@ def fetch_all_linear_data():
     print("="*80)
     print(f"Project: {project_name}")
     print(f"Total Issues: {len(all_issues)}")
-    print(f"Main Components: {len(components_data)}")
-    total_tasks = sum(len(c["tasks"]) for c in components_data)
+    print(f"Main Components: {len(groups)}")
+    total_tasks = sum(len(tasks) for _, _, tasks, _ in groups)
     print(f"Tasks in Components: {total_tasks}")
     print(f"Other Tasks: {len(other_tasks)}")
     print(f"\nFiles created:")
     print(f"  - {json_file}")
+    if sqlite_file:
+        print(f"  - {sqlite_file}")
     print(f"  - {md_file}")
     print("="*80)
 
+async def fetch_project_for_export(aclient, project_name):
+    """Fetch a project, its issues and its component categories concurrently"""
+    project, parent_categories = await asyncio.gather(
+        aclient.get_project(project_name),
+        aclient.call(aclient.client.get_parent_categories, project_name)
+    )
+    issues = await aclient.get_project_issues(project["id"]) if project else []
+    return project, issues, parent_categories
+
+async def fetch_many_linear_data(project_names, team_keys, concurrency=DEFAULT_CONCURRENCY, refresh=False,
+                                 export_format="full", sqlite=False):
+    """Export several projects, plus the viewer and team workflow states, in one job
+
+    Every project, team and the viewer is fetched at the same time, so the
+    job takes about as long as the slowest single fetch. With one project
+    the exports keep their usual names; with several each project gets
+    data/linear_data_<project>.json and .md. The viewer and workflow states
+    are written to data/linear_workspace.json. The viewer, workflow states
+    and component lists come from the query cache unless refresh is set.
+    """
+    api_key = os.getenv("LINEAR_API_KEY", "your-linear-api-key-here")
+    client = PooledLinearClient(api_key, pool_size=concurrency, cache=QueryCache(), bypass_cache=refresh)
+    
+    print("="*80)
+    print(f"Fetching Linear data for {len(project_names)} project(s) and {len(team_keys)} team(s)")
+    print("="*80)
+    
+    start = time.perf_counter()
+    async with AsyncLinearClient(client, concurrency) as aclient:
+        viewer, team_states, projects = await asyncio.gather(
+            aclient.get_viewer(),
+            asyncio.gather(*(aclient.get_workflow_states(key) for key in team_keys)),
+            asyncio.gather(*(fetch_project_for_export(aclient, name) for name in project_names))
+        )
+    print(f"\n✓ Fetched everything in {time.perf_counter() - start:.1f}s")
+    
+    for project_name, (project, issues, parent_categories) in zip(project_names, projects):
+        print("\n" + "="*80)
+        print(f"Project: {project_name}")
+        print("="*80)
+        if not project:
+            print(f"ERROR: Project '{project_name}' not found!")
+            continue
+        print(f"   ✓ Found {len(issues)} total issues")
+        output_name = "linear_data"
+        if len(project_names) > 1:
+            output_name += "_" + re.sub(r"[^a-z0-9]+", "_", project_name.lower()).strip("_")
+        all_issues, issues_by_identifier, children_by_parent = index_issues(issues)
+        export_linear_data(project_name, project, all_issues, issues_by_identifier, children_by_parent,
+                           parent_categories, output_name, export_format, sqlite)
+    
+    workspace_file = os.path.join(os.path.dirname(__file__), "..", "data", "linear_workspace.json")
+    os.makedirs(os.path.dirname(workspace_file), exist_ok=True)
+    with open(workspace_file, "w", encoding="utf-8") as f:
+        json.dump({
+            "fetched_at": datetime.now().isoformat(),
+            "viewer": viewer,
+            "teams": dict(zip(team_keys, team_states))
+        }, f, indent=2, ensure_ascii=False)
+    print(f"\n✓ Saved viewer and workflow states to: {workspace_file}")
+
 if __name__ == "__main__":
-    fetch_all_linear_data()
+    parser = argparse.ArgumentParser(description="Export Linear components and tasks to data/")
+    parser.add_argument("--sync", action="store_true",
+                        help="fetch only issues changed since the last sync, via the local cache")
+    parser.add_argument("--full-sync", action="store_true",
+                        help="rebuild the local cache from a complete fetch")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH,
+                        help="SQLite cache used by --sync (default: data/linear_cache.sqlite)")
+    parser.add_argument("--project", action="append", default=[], metavar="NAME",
+                        help=f"project to export; repeat to fetch several concurrently (default: {DEFAULT_PROJECT_NAME})")
+    parser.add_argument("--team", action="append", default=[], metavar="KEY",
+                        help="team whose workflow states to export; repeatable")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"queries in flight at once when fetching concurrently (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--refresh", action="store_true",
+                        help="re-query the viewer, workflow states and component lists instead of using the query cache")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="full",
+                        help="data file layout: full (nested, issues copied), normalized (each issue once) "
+                             "or jsonl (normalized records, one per line); default: full")
+    parser.add_argument("--sqlite", action="store_true",
+                        help="also write an indexed SQLite database (data/linear_data.sqlite) for queries")
+    args = parser.parse_args()
+    if args.project or args.team:
+        if args.sync or args.full_sync:
+            parser.error("--sync works on a single project; drop --project/--team")
+        asyncio.run(fetch_many_linear_data(args.project or [DEFAULT_PROJECT_NAME], args.team, args.concurrency,
+                                           refresh=args.refresh, export_format=args.format, sqlite=args.sqlite))
+    else:
+        fetch_all_linear_data(sync=args.sync, full_sync=args.full_sync, cache_path=args.cache, refresh=args.refresh,
+                              export_format=args.format, sqlite=args.sqlite)
 
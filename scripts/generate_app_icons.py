@@ -9,8 +9,23 @@ Theme: Abstract flowing waves representing the natural rhythm of sleep cycles,
 using a sophisticated teal-to-deep-blue gradient palette.
 """
 
+import argparse
+import ast
+import functools
+import hashlib
+import io
+import json
 import math
-from PIL import Image, ImageDraw, ImageFilter
+import os
+import struct
+import time
+import types
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import numpy as np
+import PIL
+from PIL import Image
 
 # Color palette - elegant circadian/longevity theme
 COLORS = {
@@ -31,264 +46,1078 @@ COLORS = {
 }
 
 
-def create_gradient(size):
-    """Create a sophisticated three-point vertical gradient background."""
-    img = Image.new('RGBA', (size, size))
-
-    for y in range(size):
-        ratio = y / size
-
-        if ratio < 0.5:
-            # Top to middle
-            r = ratio * 2
-            c1, c2 = COLORS['gradient_top'], COLORS['gradient_mid']
-        else:
-            # Middle to bottom
-            r = (ratio - 0.5) * 2
-            c1, c2 = COLORS['gradient_mid'], COLORS['gradient_bottom']
-
-        red = int(c1[0] * (1 - r) + c2[0] * r)
-        green = int(c1[1] * (1 - r) + c2[1] * r)
-        blue = int(c1[2] * (1 - r) + c2[2] * r)
-
-        for x in range(size):
-            img.putpixel((x, y), (red, green, blue, 255))
-
-    return img
-
-
-def draw_circadian_wave(draw, size, y_offset, amplitude, wavelength, color, thickness, phase=0):
-    """Draw a flowing sine wave representing circadian rhythm."""
-    points = []
-
-    for x in range(size + 10):
-        # Sine wave with phase offset
-        y = y_offset + amplitude * math.sin(2 * math.pi * (x / wavelength) + phase)
-        points.append((x, y))
-
-    # Draw thick smooth wave
-    if len(points) > 1:
-        for i in range(len(points) - 1):
-            draw.line([points[i], points[i + 1]], fill=color, width=thickness)
-
-
-def draw_wave_with_gradient(img, size, y_base, amplitude, wavelength, thickness, phase=0, alpha_start=200, alpha_end=80):
-    """Draw a wave with gradient alpha for a glowing effect."""
-    draw = ImageDraw.Draw(img, 'RGBA')
-
-    for offset in range(thickness, 0, -1):
-        alpha = int(alpha_start - (alpha_start - alpha_end) * (thickness - offset) / thickness)
-
-        # Color interpolation from primary to accent
-        ratio = offset / thickness
-        r = int(COLORS['wave_primary'][0] * ratio + COLORS['wave_accent'][0] * (1 - ratio))
-        g = int(COLORS['wave_primary'][1] * ratio + COLORS['wave_accent'][1] * (1 - ratio))
-        b = int(COLORS['wave_primary'][2] * ratio + COLORS['wave_accent'][2] * (1 - ratio))
-
-        color = (r, g, b, alpha)
-
-        for x in range(size):
-            y = y_base + amplitude * math.sin(2 * math.pi * (x / wavelength) + phase)
-
-            # Draw vertical gradient line at this x position
-            for dy in range(-offset, offset + 1):
-                py = int(y + dy)
-                if 0 <= py < size:
-                    existing = img.getpixel((x, py))
-                    # Alpha blend
-                    blend_alpha = alpha / 255
-                    new_r = int(existing[0] * (1 - blend_alpha) + r * blend_alpha)
-                    new_g = int(existing[1] * (1 - blend_alpha) + g * blend_alpha)
-                    new_b = int(existing[2] * (1 - blend_alpha) + b * blend_alpha)
-                    img.putpixel((x, py), (new_r, new_g, new_b, 255))
-
-
-def draw_energy_orb(img, size, center_x, center_y, radius):
-    """Draw a subtle energy orb representing vitality/longevity."""
-    draw = ImageDraw.Draw(img, 'RGBA')
-
-    # Draw concentric circles with decreasing alpha
-    for r in range(int(radius), 0, -1):
-        alpha = int(60 * (r / radius))
-
-        # Interpolate color from warm to soft
-        ratio = r / radius
-        red = int(COLORS['energy_warm'][0] * ratio + COLORS['energy_soft'][0] * (1 - ratio))
-        green = int(COLORS['energy_warm'][1] * ratio + COLORS['energy_soft'][1] * (1 - ratio))
-        blue = int(COLORS['energy_warm'][2] * ratio + COLORS['energy_soft'][2] * (1 - ratio))
-
-        bbox = [center_x - r, center_y - r, center_x + r, center_y + r]
-        draw.ellipse(bbox, fill=(red, green, blue, alpha))
-
-
-def draw_flow_lines(img, size):
-    """Draw subtle flowing lines representing sleep cycle transitions."""
-    draw = ImageDraw.Draw(img, 'RGBA')
+class Canvas:
+    """Float compositing buffer for rows [top, bottom) of a size x size icon.
+
+    Every design element is composited into one float32 RGB buffer with the
+    premultiplied "over" operator, and the result is quantized to 8 bits
+    once, in to_image(). The background layer is opaque, so the buffer's
+    alpha is always 1 and is not stored. A canvas that records a layer on
+    its own also tracks transmittance, the share of whatever lies beneath
+    that still shows through.
+    """
+
+    def __init__(self, size, top=0, bottom=None, record=False):
+        self.size = size
+        self.top = top
+        self.bottom = size if bottom is None else bottom
+        self.pixels = np.zeros((self.bottom - self.top, size, 3), dtype=np.float32)
+        self.transmittance = np.ones((self.bottom - self.top, size, 1), dtype=np.float32) if record else None
+
+    def clip_rows(self, top, bottom):
+        """Intersect an icon row range with the rows held by this canvas."""
+        return max(top, self.top), min(bottom, self.bottom)
+
+    def over(self, top, color, alpha, left=0):
+        """Composite a premultiplied patch whose top-left pixel is (left, top)."""
+        height, width = alpha.shape[:2]
+        region = self.pixels[top - self.top:top - self.top + height, left:left + width]
+        region *= 1 - alpha
+        region += color
+        if self.transmittance is not None:
+            self.transmittance[top - self.top:top - self.top + height, left:left + width] *= 1 - alpha
+
+    def quantize(self):
+        """Round the buffer to 8-bit RGB pixels."""
+        quantized = np.rint(self.pixels)
+        np.clip(quantized, 0, 255, out=quantized)
+        return quantized.astype(np.uint8)
+
+    def to_image(self):
+        """Quantize the buffer to an 8-bit RGB image."""
+        return Image.fromarray(self.quantize())
+
+
+def draw_circadian_wave(canvas, y_offset, amplitude, wavelength, color, thickness, phase=0):
+    """Draw a flowing sine wave representing circadian rhythm.
+
+    The sine and its slope are sampled in bulk and the wave is stroked as
+    one continuous curve: each pixel's coverage comes from its distance to
+    the curve (vertical offset scaled by the local slope), which gives
+    anti-aliased edges and no seams between segments. Strokes are opaque
+    in proportion to coverage, matching the icons as they were first drawn
+    with ImageDraw, so color is a plain RGB triple.
+    """
+    x = np.arange(canvas.size)
+    angle = 2 * np.pi * (x / wavelength) + phase
+    y = y_offset + amplitude * np.sin(angle)
+    slope = amplitude * 2 * np.pi / wavelength * np.cos(angle)
+
+    top, bottom = canvas.clip_rows(math.floor(y.min() - thickness), math.ceil(y.max() + thickness) + 1)
+    if top >= bottom:
+        return
+
+    # Per-column terms in double precision, the per-pixel arrays in float32
+    rows = np.arange(top, bottom, dtype=np.float32)[:, None]
+    distance = np.abs(rows - y.astype(np.float32))
+    distance *= (1 / np.sqrt(1 + slope ** 2)).astype(np.float32)
+    coverage = np.clip(np.float32(thickness / 2 + 0.5) - distance, 0, 1)[..., None]
+    canvas.over(top, coverage * np.array(color, dtype=np.float32), coverage)
+
+
+def draw_wave_with_gradient(canvas, y_base, amplitude, wavelength, thickness, phase=0, alpha_start=200, alpha_end=80):
+    """Draw a wave with gradient alpha for a glowing effect.
+
+    The glow is a stack of bands (offset = thickness .. 1), each a constant
+    colour blended over the ones before it. A pixel at distance d from the
+    wave is covered by every band with offset >= d, so the whole stack
+    collapses to one premultiplied colour and alpha per depth and each
+    pixel of the band is composited exactly once.
+    """
+    offsets = np.arange(thickness, 0, -1)
+    alphas = (alpha_start - (alpha_start - alpha_end) * (thickness - offsets) / thickness).astype(int) / 255
+
+    # Color interpolation from primary to accent
+    ratio = (offsets / thickness)[:, None]
+    primary = np.array(COLORS['wave_primary'], dtype=np.float64)
+    accent = np.array(COLORS['wave_accent'], dtype=np.float64)
+    colors = (primary * ratio + accent * (1 - ratio)).astype(int)
+
+    # Fold the bands from the outermost inwards, indexed by depth; depths
+    # beyond the outermost band are left untouched
+    premultiplied = np.zeros((thickness + 2, 3), dtype=np.float32)
+    coverage = np.zeros((thickness + 2, 1), dtype=np.float32)
+    color_acc, trans_acc = np.zeros(3), 1.0
+    for offset, alpha, color in zip(offsets, alphas, colors):
+        color_acc = color_acc * (1 - alpha) + color * alpha
+        trans_acc *= 1 - alpha
+        premultiplied[offset] = color_acc
+        coverage[offset] = 1 - trans_acc
+    premultiplied[0], coverage[0] = premultiplied[1], coverage[1]
+
+    # Depth of every pixel in the rows the band spans
+    x = np.arange(canvas.size)
+    center = np.floor(y_base + amplitude * np.sin(2 * np.pi * (x / wavelength) + phase)).astype(np.int32)
+    top, bottom = canvas.clip_rows(int(center.min()) - thickness, int(center.max()) + thickness + 1)
+    if top >= bottom:
+        return
+    depth = np.minimum(np.abs(np.arange(top, bottom, dtype=np.int32)[:, None] - center), thickness + 1)
+    canvas.over(top, premultiplied[depth], coverage[depth])
+
+
+def ellipse_half_widths(a, b):
+    """Row half-widths of filled ellipses exactly as ImageDraw rasterises them.
+
+    ImageDraw walks a quarter of each ellipse in doubled coordinates, from
+    (a, b % 2) to (a % 2, b) where a and b are the bounding box's width and
+    height, always stepping to whichever of three neighbours lies nearest
+    the curve, and fills each row out to the widest point reached on it.
+    The walks run here in lockstep for all ellipses. Returns (widths,
+    first) where widths[first[i] + j] is the doubled half-width of ellipse
+    i on level b % 2 + 2j; each ellipse has b // 2 + 1 levels.
+    """
+    a = a.astype(np.int64)
+    b = b.astype(np.int64)
+    a2, b2 = a * a, b * b
+    a2b2 = a2 * b2
+    index = np.arange(len(a))
+    x, y = a.copy(), b % 2
+    first = np.concatenate(([0], np.cumsum(b // 2 + 1)[:-1]))
+    widths = np.zeros(int((b // 2 + 1).sum()), dtype=np.int16)
+    widths[first] = x
+    walking = index[(x != a % 2) | (y != b)]
+    while len(walking):
+        cx, cy = x[walking], y[walking]
+        ea, eb, eab = a2[walking], b2[walking], a2b2[walking]
+
+        def error(px, py):
+            return np.abs(ea * py * py + eb * px * px - eab)
+
+        nx, ny = cx, cy + 2
+        best = error(nx, ny)
+        diagonal = error(cx - 2, cy + 2)
+        take = (cx > 1) & (diagonal < best)
+        nx = np.where(take, cx - 2, nx)
+        best = np.where(take, diagonal, best)
+        across = error(cx - 2, cy)
+        take = (cx > 1) & (across < best)
+        nx = np.where(take, cx - 2, nx)
+        ny = np.where(take, cy, ny)
+
+        x[walking], y[walking] = nx, ny
+        slot = first[walking] + (ny - b[walking] % 2) // 2
+        widths[slot] = np.maximum(widths[slot], nx)
+        walking = walking[(nx != a[walking] % 2) | (ny != b[walking])]
+    return widths, first
+
+
+@functools.lru_cache(maxsize=4)
+def orb_circles(center_x, center_y, outer):
+    """Bounding boxes and row half-widths of the orb's circles, radius 1 to outer.
+
+    Computed once per render and shared by every band. ImageDraw truncates
+    each circle's box to whole pixels.
+    """
+    radii = np.arange(1, outer + 1)
+    x0, x1 = np.trunc(center_x - radii).astype(int), np.trunc(center_x + radii).astype(int)
+    y0, y1 = np.trunc(center_y - radii).astype(int), np.trunc(center_y + radii).astype(int)
+    return (x0, y0, x1 - x0, y1 - y0, *ellipse_half_widths(x1 - x0, y1 - y0))
+
+
+def draw_energy_orb(canvas, center_x, center_y, radius):
+    """Draw a subtle energy orb representing vitality/longevity.
+
+    The orb was first drawn as concentric ellipses from the outside in with
+    ImageDraw, which replaced rather than blended, so every pixel ended up
+    with the colour of the smallest circle covering it. Every circle's row
+    spans are known from orb_circles, and they all contain the centre
+    column, so on each row the smallest circle covering a pixel left of
+    the centre is a running minimum over where the spans start, and right
+    of it over where they end.
+    """
+    outer = int(radius)
+    if outer < 1:
+        return
+
+    size = canvas.size
+    left = max(0, math.floor(center_x - outer))
+    right = min(size, math.ceil(center_x + outer) + 1)
+    top, bottom = canvas.clip_rows(math.floor(center_y - outer), math.ceil(center_y + outer) + 1)
+    if left >= right or top >= bottom:
+        return
+
+    # Each circle's span on each row of the box, where it has one
+    x0, y0, a, b, widths, first = orb_circles(center_x, center_y, outer)
+    offset = np.arange(top, bottom, dtype=np.int32) - y0[:, None]
+    on_row = (offset >= 0) & (offset <= b[:, None])
+    level = np.where(on_row, (np.abs(2 * offset - b[:, None]) - b[:, None] % 2) // 2, 0)
+    half = widths[first[:, None] + level]
+    circle, row = np.nonzero(on_row)
+    start = np.clip(x0[circle] + (a[circle] - half[circle, row]) // 2 - left, 0, right - left - 1)
+    end = np.clip(x0[circle] + (a[circle] + half[circle, row]) // 2 - left, 0, right - left - 1)
+
+    from_left = np.full((bottom - top, right - left), outer + 1, dtype=np.int32)
+    from_right = from_left.copy()
+    np.minimum.at(from_left, (row, start), circle + 1)
+    np.minimum.at(from_right, (row, end), circle + 1)
+    np.minimum.accumulate(from_left, axis=1, out=from_left)
+    from_right = np.minimum.accumulate(from_right[:, ::-1], axis=1)[:, ::-1]
+    center = int(center_x) - left
+    r = np.where(np.arange(right - left) <= center, from_left, from_right)
+
+    # Interpolate color from warm to soft, one entry per label; label
+    # outer + 1 (outside every circle) stays transparent
+    ratio = (np.arange(outer + 2) / radius)[:, None]
+    warm = np.array(COLORS['energy_warm'], dtype=np.float64)
+    soft = np.array(COLORS['energy_soft'], dtype=np.float64)
+    colors = (warm * ratio + soft * (1 - ratio)).astype(int).astype(np.float32)
+    alphas = np.ones((outer + 2, 1), dtype=np.float32)
+    colors[outer + 1] = alphas[outer + 1] = 0
+    canvas.over(top, colors[r], alphas[r], left=left)
+
+
+def blur_taps(radius):
+    """Number of neighbouring pixels on each side that a blur of radius reads."""
+    return max(1, math.ceil(radius * 3))
+
+
+def gaussian_blur(canvas, radius):
+    """Blur the canvas in place with a separable Gaussian (edges extended)."""
+    taps = blur_taps(radius)
+    offsets = np.arange(-taps, taps + 1)
+    kernel = np.exp(-offsets ** 2 / (2 * radius ** 2)).astype(np.float32)
+    kernel /= kernel.sum()
+
+    # Vertical pass into a scratch buffer, horizontal pass back into the canvas
+    pixels = canvas.pixels
+    height, width = pixels.shape[:2]
+    scratch = np.empty_like(pixels)
+    padded = np.pad(pixels, ((taps, taps), (0, 0), (0, 0)), mode='edge')
+    np.multiply(padded[:height], kernel[0], out=pixels)
+    for i, weight in enumerate(kernel[1:], 1):
+        np.multiply(padded[i:i + height], weight, out=scratch)
+        pixels += scratch
+    padded = np.pad(pixels, ((0, 0), (taps, taps), (0, 0)), mode='edge')
+    np.multiply(padded[:, :width], kernel[0], out=pixels)
+    for i, weight in enumerate(kernel[1:], 1):
+        np.multiply(padded[:, i:i + width], weight, out=scratch)
+        pixels += scratch
+
+
+def gradient_layer(canvas):
+    """Sophisticated three-point vertical gradient background.
+
+    The gradient only varies by row, so one column of colours is computed
+    and broadcast across the width.
+    """
+    ratio = np.arange(canvas.top, canvas.bottom) / canvas.size
+    top = np.array(COLORS['gradient_top'], dtype=np.float64)
+    mid = np.array(COLORS['gradient_mid'], dtype=np.float64)
+    bottom = np.array(COLORS['gradient_bottom'], dtype=np.float64)
+
+    # Top to middle for the upper half, middle to bottom for the lower half
+    upper = (ratio < 0.5)[:, None]
+    r = np.where(upper, ratio[:, None] * 2, (ratio[:, None] - 0.5) * 2)
+    c1 = np.where(upper, top, mid)
+    c2 = np.where(upper, mid, bottom)
+    canvas.pixels[:] = (c1 * (1 - r) + c2 * r)[:, None, :]
+
+
+def flow_lines_layer(canvas):
+    """Subtle flowing lines representing sleep cycle transitions."""
+    size = canvas.size
 
     # Multiple subtle flow lines
     line_configs = [
-        {'y': size * 0.25, 'amp': size * 0.03, 'wl': size * 0.8, 'phase': 0, 'alpha': 30},
-        {'y': size * 0.45, 'amp': size * 0.05, 'wl': size * 0.6, 'phase': 1.5, 'alpha': 40},
-        {'y': size * 0.65, 'amp': size * 0.04, 'wl': size * 0.7, 'phase': 3.0, 'alpha': 35},
-        {'y': size * 0.85, 'amp': size * 0.03, 'wl': size * 0.9, 'phase': 4.5, 'alpha': 25},
+        {'y': size * 0.25, 'amp': size * 0.03, 'wl': size * 0.8, 'phase': 0},
+        {'y': size * 0.45, 'amp': size * 0.05, 'wl': size * 0.6, 'phase': 1.5},
+        {'y': size * 0.65, 'amp': size * 0.04, 'wl': size * 0.7, 'phase': 3.0},
+        {'y': size * 0.85, 'amp': size * 0.03, 'wl': size * 0.9, 'phase': 4.5},
     ]
 
     for cfg in line_configs:
-        color = (*COLORS['wave_glow'][:3], cfg['alpha'])
         draw_circadian_wave(
-            draw, size,
+            canvas,
             y_offset=cfg['y'],
             amplitude=cfg['amp'],
             wavelength=cfg['wl'],
-            color=color,
+            color=COLORS['wave_glow'],
             thickness=max(1, int(size * 0.005)),
             phase=cfg['phase']
         )
 
 
-def create_zoe_sleep_icon(size):
-    """Create the Zoe Sleep app icon with circadian wave design."""
-    # Start with gradient background
-    img = create_gradient(size)
-
-    # Add subtle flow lines for texture (only on larger icons)
-    if size >= 60:
-        draw_flow_lines(img, size)
-
-    # Main wave parameters - the primary visual element
-    wave_y = size * 0.55
-    wave_amplitude = size * 0.12
-    wave_wavelength = size * 0.5
-    wave_thickness = max(3, int(size * 0.06))
-
-    # Draw main glowing wave
-    if size >= 40:
-        draw_wave_with_gradient(
-            img, size,
-            y_base=wave_y,
-            amplitude=wave_amplitude,
-            wavelength=wave_wavelength,
-            thickness=wave_thickness,
-            phase=0.5,
-            alpha_start=220,
-            alpha_end=60
-        )
+def main_wave_geometry(size):
+    """Main wave parameters - the primary visual element."""
+    return {
+        'y': size * 0.55,
+        'amplitude': size * 0.12,
+        'wavelength': size * 0.5,
+        'thickness': max(3, int(size * 0.06)),
+    }
+
+
+def main_wave_layer(canvas):
+    """Main glowing wave."""
+    wave = main_wave_geometry(canvas.size)
+    draw_wave_with_gradient(
+        canvas,
+        y_base=wave['y'],
+        amplitude=wave['amplitude'],
+        wavelength=wave['wavelength'],
+        thickness=wave['thickness'],
+        phase=0.5,
+        alpha_start=220,
+        alpha_end=60
+    )
+
+
+def secondary_wave_layer(canvas):
+    """Secondary wave, offset from the main wave and smaller."""
+    size = canvas.size
+    wave = main_wave_geometry(size)
+    draw_circadian_wave(
+        canvas,
+        y_offset=wave['y'] - size * 0.08,
+        amplitude=wave['amplitude'] * 0.7,
+        wavelength=wave['wavelength'] * 1.2,
+        color=COLORS['wave_secondary'],
+        thickness=max(2, int(wave['thickness'] * 0.5)),
+        phase=2.0
+    )
+
+
+def energy_orb_layer(canvas):
+    """Subtle energy orb representing vitality."""
+    size = canvas.size
+    draw_energy_orb(canvas, center_x=size * 0.75, center_y=size * 0.35, radius=size * 0.12)
+
+
+def highlight_wave_layer(canvas):
+    """Subtle highlight wave on top."""
+    size = canvas.size
+    wave = main_wave_geometry(size)
+    draw_circadian_wave(
+        canvas,
+        y_offset=wave['y'] + size * 0.06,
+        amplitude=wave['amplitude'] * 0.5,
+        wavelength=wave['wavelength'] * 0.8,
+        color=COLORS['wave_glow'],
+        thickness=max(1, int(size * 0.015)),
+        phase=1.0
+    )
+
+
+BLUR_RADIUS = 0.5
+
+
+def blur_layer(canvas):
+    """Subtle blur for smoothness."""
+    gaussian_blur(canvas, radius=BLUR_RADIUS)
+
+
+# Design elements from bottom to top: (name, minimum icon size, layer).
+# Smaller icons leave out the finer elements.
+ICON_LAYERS = [
+    ('gradient', 0, gradient_layer),
+    ('flow_lines', 60, flow_lines_layer),
+    ('main_wave', 40, main_wave_layer),
+    ('secondary_wave', 60, secondary_wave_layer),
+    ('energy_orb', 100, energy_orb_layer),
+    ('highlight_wave', 80, highlight_wave_layer),
+    ('blur', 120, blur_layer),
+]
+
+# Layers that transform the pixels beneath them rather than drawing over them
+FILTER_LAYERS = {'blur'}
+
+
+def active_layers(size, enabled=None):
+    """Return the (name, layer) pairs drawn at a size, optionally filtered by name."""
+    return [
+        (name, layer) for name, min_size, layer in ICON_LAYERS
+        if size >= min_size and (enabled is None or name in enabled)
+    ]
 
-    # Draw secondary wave (offset and smaller)
-    if size >= 60:
-        draw = ImageDraw.Draw(img, 'RGBA')
-        secondary_color = (*COLORS['wave_secondary'][:3], 120)
-        draw_circadian_wave(
-            draw, size,
-            y_offset=wave_y - size * 0.08,
-            amplitude=wave_amplitude * 0.7,
-            wavelength=wave_wavelength * 1.2,
-            color=secondary_color,
-            thickness=max(2, int(wave_thickness * 0.5)),
-            phase=2.0
-        )
 
-    # Add subtle energy orb (representing vitality) - only on larger icons
-    if size >= 100:
-        orb_x = size * 0.75
-        orb_y = size * 0.35
-        orb_radius = size * 0.12
-        draw_energy_orb(img, size, orb_x, orb_y, orb_radius)
-
-    # Add a subtle highlight wave on top
-    if size >= 80:
-        draw = ImageDraw.Draw(img, 'RGBA')
-        highlight_color = (*COLORS['wave_glow'][:3], 100)
-        draw_circadian_wave(
-            draw, size,
-            y_offset=wave_y + size * 0.06,
-            amplitude=wave_amplitude * 0.5,
-            wavelength=wave_wavelength * 0.8,
-            color=highlight_color,
-            thickness=max(1, int(size * 0.015)),
-            phase=1.0
-        )
+def create_zoe_sleep_icon(size, layers=None, threads=1):
+    """Create the Zoe Sleep app icon with circadian wave design.
 
-    # Apply subtle blur for smoothness on larger icons
-    if size >= 120:
-        img = img.filter(ImageFilter.GaussianBlur(radius=0.5))
-
-    return img.convert('RGB')
-
-
-def generate_ios_icons(base_path):
-    """Generate all required iOS app icon sizes."""
-    ios_sizes = [
-        # (filename, actual_pixel_size)
-        ('icon-20x20.png', 20),
-        ('icon-20x20@2x.png', 40),
-        ('icon-20x20@3x.png', 60),
-        ('icon-29x29.png', 29),
-        ('icon-29x29@2x.png', 58),
-        ('icon-29x29@3x.png', 87),
-        ('icon-40x40.png', 40),
-        ('icon-40x40@2x.png', 80),
-        ('icon-40x40@3x.png', 120),
-        ('icon-60x60@2x.png', 120),
-        ('icon-60x60@3x.png', 180),
-        ('icon-76x76.png', 76),
-        ('icon-76x76@2x.png', 152),
-        ('icon-83.5x83.5@2x.png', 167),
-        ('icon-1024x1024.png', 1024),
-    ]
+    layers optionally restricts rendering to the named ICON_LAYERS. With
+    threads > 1 the canvas is split into row bands rendered concurrently;
+    the kernels spend their time in whole-array numpy operations, which
+    release the GIL, and the result is identical to a single-threaded
+    render.
+    """
+    if threads > 1 and size >= threads:
+        edges = [size * i // threads for i in range(threads + 1)]
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            bands = pool.map(render_band, [size] * threads, edges[:-1], edges[1:], [layers] * threads)
+            return Image.fromarray(np.concatenate(list(bands)))
+
+    canvas = Canvas(size)
+    for _, layer in active_layers(size, layers):
+        layer(canvas)
+    return canvas.to_image()
+
+
+def render_band(size, top, bottom, layers=None):
+    """Render icon rows [top, bottom) as an 8-bit RGB array.
+
+    The band is drawn with enough extra rows above and below for the blur
+    to see the same neighbours it would in a full render, so stacking the
+    bands reproduces create_zoe_sleep_icon exactly.
+    """
+    drawn = active_layers(size, layers)
+    margin = blur_taps(BLUR_RADIUS) if any(name == 'blur' for name, _ in drawn) else 0
+    canvas = Canvas(size, max(0, top - margin), min(size, bottom + margin))
+    for _, layer in drawn:
+        layer(canvas)
+    return canvas.quantize()[top - canvas.top:bottom - canvas.top]
+
+
+def band_rows(width, budget=None):
+    """Rows per band that keep a band of this width within the pixel budget."""
+    return max(1, (budget or BAND_PIXEL_BUDGET) // width)
+
+
+def iter_icon_bands(size, band_height=None, layers=None):
+    """Yield the icon as successive horizontal bands.
+
+    Bands default to band_rows(size) rows, so each one holds about the
+    same number of pixels whatever the icon size, and the kernels keep
+    their per-pixel temporaries in float32. Peak memory stays roughly
+    constant from 1024px to 8192px and beyond, which keeps print-size
+    renders affordable.
+    """
+    band_height = band_height or band_rows(size)
+    for top in range(0, size, band_height):
+        yield render_band(size, top, min(size, top + band_height), layers)
+
+
+# Asset catalogs whose Contents.json declares the icons to build:
+# (label, path relative to the project root)
+ASSET_CATALOGS = [
+    ('iOS', ('ZoeSleep', 'ZoeSleep', 'Assets.xcassets', 'AppIcon.appiconset')),
+    ('watchOS', ('ZoeSleep', 'ZoeSleep Watch App', 'Assets.xcassets', 'AppIcon.appiconset')),
+    ('Launch Screen', ('ZoeSleep', 'ZoeSleep', 'Assets.xcassets', 'LaunchIcon.imageset')),
+]
+
+# Point size of catalog images that do not declare one (the launch icon)
+DEFAULT_IMAGE_POINTS = 200
+
+# Extra outputs under docs/: (filename, actual_pixel_size)
+DOCS_ICON_SIZES = [
+    ('zoe-sleep-icon-preview.png', 512),
+    ('zoe-sleep-icon-1024.png', 1024),
+]
+
+# Pixels per band when streaming print-size renders to disk
+BAND_PIXEL_BUDGET = 256 * 1024
+
+# Size thresholds at which create_zoe_sleep_icon adds design elements
+DETAIL_THRESHOLDS = tuple(sorted({min_size for _, min_size, _ in ICON_LAYERS if min_size}))
+
+
+def detail_tier(size):
+    """Return the detail tier of a pixel size (number of thresholds reached)."""
+    return sum(1 for threshold in DETAIL_THRESHOLDS if size >= threshold)
+
+
+def plan_renders(pixel_sizes, resample=False):
+    """Group the distinct pixel sizes into render units.
+
+    Each unit is rendered once at its largest size. Without resample every
+    size is its own unit; with resample there is one unit per detail tier
+    and the smaller sizes of the tier are downsampled from its master, so a
+    full regeneration costs a handful of renders instead of one per entry.
+    """
+    sizes = sorted(set(pixel_sizes))
+    if not resample:
+        return [(size,) for size in sizes]
+
+    tiers = {}
+    for size in sizes:
+        tiers.setdefault(detail_tier(size), []).append(size)
+    return [tuple(tier_sizes) for tier_sizes in tiers.values()]
+
+
+def render_group(sizes, threads=1):
+    """Render the largest size of a unit and downsample the others from it."""
+    master_size = max(sizes)
+    master = create_zoe_sleep_icon(master_size, threads=threads)
+    icons = {}
+    for size in sizes:
+        if size == master_size:
+            icons[size] = master
+        else:
+            icons[size] = master.resize((size, size), Image.Resampling.LANCZOS)
+    return icons
+
+
+# PNG encoder settings, from fastest encode to smallest file. Every preset
+# is lossless and deterministic; presets with several candidates keep the
+# smallest result (the first one on ties). compress_type is the zlib
+# strategy used for the filtered scanlines.
+PNG_PRESETS = {
+    'fastest': [{'compress_level': 1}],
+    'default': [{'compress_level': 6}],
+    'small': [{'compress_level': 9}],
+    'smallest': [
+        {'compress_level': 9},
+        {'compress_level': 9, 'compress_type': zlib.Z_FILTERED},
+        {'compress_level': 9, 'compress_type': zlib.Z_RLE},
+        {'optimize': True},
+    ],
+}
 
-    print("Generating iOS icons...")
-    for filename, pixel_size in ios_sizes:
-        icon = create_zoe_sleep_icon(pixel_size)
-        filepath = f"{base_path}/{filename}"
-        icon.save(filepath, 'PNG')
-        print(f"  Created: {filename} ({pixel_size}x{pixel_size})")
-
-    print(f"iOS icons saved to: {base_path}")
-
-
-def generate_watchos_icons(base_path):
-    """Generate all required watchOS app icon sizes."""
-    watch_sizes = [
-        # (filename, actual_pixel_size)
-        ('watch-24x24@2x.png', 48),
-        ('watch-27.5x27.5@2x.png', 55),
-        ('watch-29x29@2x.png', 58),
-        ('watch-29x29@3x.png', 87),
-        ('watch-33x33@2x.png', 66),
-        ('watch-40x40@2x.png', 80),
-        ('watch-44x44@2x.png', 88),
-        ('watch-46x46@2x.png', 92),
-        ('watch-50x50@2x.png', 100),
-        ('watch-51x51@2x.png', 102),
-        ('watch-54x54@2x.png', 108),
-        ('watch-86x86@2x.png', 172),
-        ('watch-98x98@2x.png', 196),
-        ('watch-108x108@2x.png', 216),
-        ('watch-117x117@2x.png', 234),
-        ('watch-129x129@2x.png', 258),
-        ('watch-1024x1024.png', 1024),
-    ]
 
-    print("\nGenerating watchOS icons...")
-    for filename, pixel_size in watch_sizes:
-        icon = create_zoe_sleep_icon(pixel_size)
-        filepath = f"{base_path}/{filename}"
-        icon.save(filepath, 'PNG')
-        print(f"  Created: {filename} ({pixel_size}x{pixel_size})")
+def encode_png(icon, preset='default'):
+    """Encode an icon as PNG bytes with one of the PNG_PRESETS."""
+    best = None
+    for options in PNG_PRESETS[preset]:
+        buffer = io.BytesIO()
+        icon.save(buffer, 'PNG', **options)
+        data = buffer.getvalue()
+        if best is None or len(data) < len(best):
+            best = data
+    return best
+
+
+def _timed_encode(size, icon, preset):
+    start = time.perf_counter()
+    data = encode_png(icon, preset)
+    return size, data, time.perf_counter() - start
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# tEXt keyword under which outputs record the settings they were built with
+BUILD_STAMP_KEY = b'zoe-icon-build'
+
+
+def png_chunk(tag, data):
+    """Serialise one PNG chunk."""
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+
+def stamp_png(data, stamp):
+    """Return PNG bytes with a build stamp tEXt chunk inserted after IHDR.
+
+    The stamp is added after encoding, so cached encodes are shared by
+    builds with different settings.
+    """
+    ihdr_end = len(PNG_SIGNATURE) + 25
+    return data[:ihdr_end] + png_chunk(b'tEXt', BUILD_STAMP_KEY + b'\0' + stamp.encode()) + data[ihdr_end:]
+
+
+def build_stamp(**settings):
+    """Describe the build settings that change an output's bytes."""
+    return json.dumps(settings, sort_keys=True)
+
+
+def write_png_stream(fileobj, width, height, bands, compress_level=6, stamp=None):
+    """Write 8-bit RGB bands to fileobj as a PNG without holding the image.
+
+    Rows use the PNG "Up" filter, which suits the vertical gradient, and
+    are compressed incrementally into IDAT chunks as each band arrives.
+    """
+    def chunk(tag, data):
+        fileobj.write(png_chunk(tag, data))
+
+    fileobj.write(PNG_SIGNATURE)
+    chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+    if stamp is not None:
+        chunk(b'tEXt', BUILD_STAMP_KEY + b'\0' + stamp.encode())
+
+    compressor = zlib.compressobj(compress_level)
+    previous = np.zeros(width * 3, dtype=np.uint8)
+    for band in bands:
+        rows = band.reshape(len(band), width * 3)
+        above = np.vstack((previous[None], rows[:-1]))
+        filtered = np.empty((len(rows), width * 3 + 1), dtype=np.uint8)
+        filtered[:, 0] = 2  # Up filter
+        np.subtract(rows, above, out=filtered[:, 1:])
+        data = compressor.compress(filtered.tobytes())
+        if data:
+            chunk(b'IDAT', data)
+        previous = rows[-1].copy()
+    chunk(b'IDAT', compressor.flush())
+    chunk(b'IEND', b'')
+
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'zoe-sleep-icons')
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def design_fingerprint():
+    """Hash the generator's code and constants and the library versions.
+
+    The whole module is hashed as a syntax tree, so every design parameter
+    (the palette, the ICON_LAYERS thresholds, BLUR_RADIUS, the geometry)
+    and every kernel is covered without a list to keep up to date; only
+    comment and formatting edits keep the cache.
+    """
+    with open(os.path.abspath(__file__), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    digest = hashlib.sha256()
+    digest.update(ast.dump(tree).encode())
+    digest.update(f"Pillow {PIL.__version__} numpy {np.__version__}".encode())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Content-addressed on-disk cache of encoded icons.
+
+    Entries are keyed on the design fingerprint, the PNG preset, the render
+    unit they came from and their pixel size, so any change to the palette,
+    the drawing code, the encoder settings or the tier layout misses
+    naturally. The least recently used entries are evicted once the cache
+    grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_MAX_BYTES, preset='default'):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.fingerprint = design_fingerprint()
+        self.encoding = json.dumps(PNG_PRESETS[preset], sort_keys=True)
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, unit, size):
+        key = f"{self.fingerprint}:{self.encoding}:{','.join(map(str, unit))}:{size}"
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + '.png')
+
+    def get(self, unit, size):
+        """Return cached PNG bytes, or None on a miss."""
+        path = self._path(unit, size)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        os.utime(path)
+        return data
+
+    def put(self, unit, size, data):
+        with open(self._path(unit, size), 'wb') as f:
+            f.write(data)
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits max_bytes."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.png'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+
+def render_png_bytes(pixel_sizes, resample=False, jobs=1, cache=None, preset='default', threads=1,
+                     plan_sizes=None):
+    """Render and encode every distinct size.
+
+    Returns ({size: png_bytes}, {size: encode_seconds}); sizes served from
+    the cache have no encode time. Render units are planned from
+    plan_sizes (every size the build can produce; defaults to pixel_sizes)
+    and each unit holding one of pixel_sizes is rendered whole, so with
+    resample a size always comes from the same tier master no matter
+    which other outputs happen to be stale. Units already in the cache are not
+    rendered at all. With jobs > 1 the remaining units are rendered on a
+    process pool, submitted largest first so the 1024px render does not
+    end up as a straggler. Encoding runs on its own thread pool (zlib
+    releases the GIL) and starts as soon as each unit is rendered. threads
+    splits each individual render across row bands.
+    """
+    wanted = set(pixel_sizes)
+    units = sorted((sizes for sizes in plan_renders(plan_sizes or pixel_sizes, resample) if wanted & set(sizes)),
+                   key=max, reverse=True)
+    pngs = {}
+    encode_times = {}
+
+    if cache:
+        pending = []
+        for sizes in units:
+            cached = {size: cache.get(sizes, size) for size in sizes}
+            if all(data is not None for data in cached.values()):
+                pngs.update(cached)
+            else:
+                pending.append(sizes)
+        if len(pending) < len(units):
+            print(f"  {len(units) - len(pending)} of {len(units)} render units served from cache")
+        units = pending
+
+    with ThreadPoolExecutor(max_workers=jobs) as encoder:
+        encodes = []
+
+        def rendered(done, sizes, icons):
+            for size, icon in icons.items():
+                encodes.append((sizes, encoder.submit(_timed_encode, size, icon, preset)))
+            labels = ', '.join(f"{size}px" for size in sizes)
+            print(f"  [{done}/{len(units)}] Rendered {labels}")
+
+        if jobs <= 1:
+            for done, sizes in enumerate(units, 1):
+                rendered(done, sizes, render_group(sizes, threads))
+        elif units:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = {pool.submit(render_group, sizes, threads): sizes for sizes in units}
+                for done, future in enumerate(as_completed(futures), 1):
+                    rendered(done, futures[future], future.result())
+
+        for sizes, future in encodes:
+            size, data, seconds = future.result()
+            pngs[size] = data
+            encode_times[size] = seconds
+            if cache:
+                cache.put(sizes, size, data)
+
+    if cache and units:
+        cache.evict()
+    return pngs, encode_times
+
+
+def write_if_changed(filepath, data):
+    """Write data unless the file already holds exactly these bytes.
+
+    An unchanged file still has its mtime refreshed so that the make-style
+    staleness check treats it as up to date on the next run.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            if f.read() == data:
+                os.utime(filepath)
+                return False
+    except OSError:
+        pass
+    with open(filepath, 'wb') as f:
+        f.write(data)
+    return True
+
+
+def read_catalog(catalog_path):
+    """Return the (filename, size, scale, pixel_size) outputs of an asset catalog."""
+    with open(os.path.join(catalog_path, 'Contents.json'), encoding='utf-8') as f:
+        contents = json.load(f)
+
+    outputs = {}
+    for image in contents.get('images', []):
+        filename = image.get('filename')
+        if not filename or filename in outputs:
+            continue
+        scale = image.get('scale', '1x')
+        size = image.get('size', f"{DEFAULT_IMAGE_POINTS}x{DEFAULT_IMAGE_POINTS}")
+        points = float(size.split('x')[0])
+        pixel_size = round(points * float(scale.rstrip('x')))
+        outputs[filename] = (filename, size, scale, pixel_size)
+    return list(outputs.values())
+
+
+def build_targets(project_root):
+    """Build the (catalog, size, scale) -> file graph for every output.
+
+    Returns a list of (label, directory, entries) where each entry is a
+    (filename, size, scale, pixel_size) tuple.
+    """
+    targets = []
+    for label, parts in ASSET_CATALOGS:
+        catalog_path = os.path.join(project_root, *parts)
+        if not os.path.exists(os.path.join(catalog_path, 'Contents.json')):
+            print(f"  ⚠ Skipping {label}: no Contents.json in {catalog_path}")
+            continue
+        targets.append((label, catalog_path, read_catalog(catalog_path)))
+
+    docs_entries = [(filename, None, None, pixel_size) for filename, pixel_size in DOCS_ICON_SIZES]
+    targets.append(('Docs', os.path.join(project_root, 'docs'), docs_entries))
+    return targets
+
+
+def read_png_header(filepath):
+    """Return (width, height, text) from a PNG's chunks before its image data.
+
+    The chunks are read directly rather than through Image.open, which
+    refuses print sizes as decompression bombs. A file that does not end
+    in IEND, such as one cut short mid-write, raises ValueError.
+    """
+    with open(filepath, 'rb') as f:
+        if f.read(len(PNG_SIGNATURE)) != PNG_SIGNATURE:
+            raise ValueError(f"{filepath} is not a PNG")
+        length, tag = struct.unpack('>I4s', f.read(8))
+        if tag != b'IHDR':
+            raise ValueError(f"{filepath} does not start with IHDR")
+        width, height = struct.unpack('>II', f.read(length)[:8])
+        f.seek(4, os.SEEK_CUR)
+        text = {}
+        while tag != b'IDAT':
+            length, tag = struct.unpack('>I4s', f.read(8))
+            if tag == b'tEXt':
+                keyword, _, value = f.read(length).partition(b'\0')
+                text[keyword] = value.decode('latin-1')
+                f.seek(4, os.SEEK_CUR)
+            else:
+                f.seek(length + 4, os.SEEK_CUR)
+        f.seek(-12, os.SEEK_END)
+        if f.read(12) != png_chunk(b'IEND', b''):
+            raise ValueError(f"{filepath} is truncated")
+    return width, height, text
+
+
+def is_stale(filepath, pixel_size, source_mtime, stamp=None):
+    """Return True if an output is missing, the wrong size or older than the generator.
+
+    With a stamp, an output built with other settings (see build_stamp)
+    is stale too. Unreadable or truncated files are always stale.
+    """
+    try:
+        if os.path.getmtime(filepath) < source_mtime:
+            return True
+        width, height, text = read_png_header(filepath)
+    except (OSError, ValueError, struct.error):
+        return True
+    if stamp is not None and text.get(BUILD_STAMP_KEY) != stamp:
+        return True
+    return (width, height) != (pixel_size, pixel_size)
+
+
+def load_design(path):
+    """Execute the generator source at path as a fresh module.
+
+    Returns (module, tree) where tree is the parsed source the module was
+    built from, so both always describe the same revision of the file.
+    """
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    tree = ast.parse(source, path)
+    module = types.ModuleType('zoe_icon_design')
+    module.__file__ = path
+    exec(compile(tree, path, 'exec'), module.__dict__)
+    return module, tree
+
+
+def layer_fingerprints(module, tree):
+    """Return {layer name: digest of everything that layer's pixels depend on}.
+
+    A layer depends on its own code, every module-level function or class
+    it reaches (the Canvas it draws on included), and the module-level
+    values those read. Values indexed only by literal keys, like
+    COLORS['energy_warm'], contribute just those entries, so recolouring
+    the orb leaves the wave layers untouched. Definitions are compared as
+    ASTs, so editing comments or docstrings changes nothing.
+    """
+    definitions = {node.name: node for node in tree.body
+                   if isinstance(node, (ast.FunctionDef, ast.ClassDef))}
+    values = {target.id for node in tree.body if isinstance(node, ast.Assign)
+              for target in node.targets if isinstance(target, ast.Name)}
+
+    def references(name):
+        """Yield (global name, literal key or None) for each use within name."""
+        keyed = set()
+        for node in ast.walk(definitions[name]):
+            if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) \
+                    and isinstance(node.slice, ast.Constant):
+                keyed.add(node.value)
+                yield node.value.id, node.slice.value
+            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load) and node not in keyed:
+                yield node.id, None
+
+    fingerprints = {}
+    for name, _, layer in module.ICON_LAYERS:
+        pending = [layer.__name__, 'Canvas']
+        seen = set()
+        keys = {}
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            for ref, key in references(current):
+                if ref in definitions:
+                    pending.append(ref)
+                elif ref in values:
+                    keys.setdefault(ref, set()).add(key)
+
+        digest = hashlib.sha256()
+        for current in sorted(seen):
+            digest.update(ast.dump(definitions[current]).encode())
+        for ref in sorted(keys):
+            value = getattr(module, ref)
+            if None in keys[ref]:
+                digest.update(f"{ref}={value!r}".encode())
+            else:
+                for key in sorted(keys[ref], key=repr):
+                    digest.update(f"{ref}[{key!r}]={value.get(key)!r}".encode())
+        fingerprints[name] = digest.hexdigest()
+    return fingerprints
+
+
+class LayerContributions:
+    """Each drawn layer's contribution to one icon size, kept between renders.
+
+    A drawing layer only composites over what lies beneath it, so drawing
+    it alone on a recording canvas gives its premultiplied colour and
+    transmittance, and the icon is those contributions composited in
+    order. Only layers whose fingerprint changed are drawn again; filter
+    layers (the blur) run on the composite every time. The background
+    writes its pixels outright, which composites the same way because it
+    is the bottom layer.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.stack = []
+        self.image = None
+        self.contributions = {}   # layer name -> (fingerprint, colour, transmittance)
+
+    def render(self, module, fingerprints):
+        """Bring the icon up to date and return (image, names re-rendered)."""
+        layers = module.active_layers(self.size)
+        stack = [(name, fingerprints[name]) for name, _ in layers]
+        if stack == self.stack:
+            return self.image, []
+
+        canvas = module.Canvas(self.size)
+        rendered = []
+        for name, layer in layers:
+            if name in module.FILTER_LAYERS:
+                layer(canvas)
+                rendered.append(name)
+                continue
+            cached = self.contributions.get(name)
+            if cached is None or cached[0] != fingerprints[name]:
+                recording = module.Canvas(self.size, record=True)
+                layer(recording)
+                cached = (fingerprints[name], recording.pixels, recording.transmittance)
+                self.contributions[name] = cached
+                rendered.append(name)
+            canvas.pixels *= cached[2]
+            canvas.pixels += cached[1]
+
+        self.stack = stack
+        self.image = canvas.to_image()
+        return self.image, rendered
+
+
+def watch(path, preview_path, size, interval=0.25):
+    """Re-render the preview whenever the generator source changes.
+
+    The process stays warm between edits and only re-draws the layers
+    whose code or parameters changed. Runs until interrupted.
+    """
+    contributions = LayerContributions(size)
+    last_mtime = None
+    print(f"Watching {os.path.basename(path)} - previewing {size}x{size} at {preview_path}")
+    print("Press Ctrl+C to stop.\n")
+    try:
+        while True:
+            mtime = os.path.getmtime(path)
+            if mtime != last_mtime:
+                last_mtime = mtime
+                start = time.perf_counter()
+                try:
+                    module, tree = load_design(path)
+                    image, rendered = contributions.render(module, layer_fingerprints(module, tree))
+                    data = module.encode_png(image)
+                except Exception as e:  # keep watching through half-finished edits
+                    print(f"  ✗ {type(e).__name__}: {e}")
+                else:
+                    elapsed = (time.perf_counter() - start) * 1000
+                    if not rendered:
+                        print(f"  No layer changes ({elapsed:.0f} ms)")
+                    else:
+                        write_if_changed(preview_path, data)
+                        print(f"  Re-rendered {', '.join(rendered)} ({elapsed:.0f} ms)")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+
+def generate_icons(stale, args, jobs, all_sizes, stamp):
+    """Render and write every stale (label, filepath, pixel_size) output.
+
+    all_sizes lists the pixel size of every output, stale or not, so that
+    resampled outputs are planned the same way on partial builds. Every
+    output written carries the build stamp.
+    """
+    pixel_sizes = [pixel_size for _, _, pixel_size in stale]
+    print(f"Rendering {len(set(pixel_sizes))} distinct sizes ({jobs} job(s))...")
+    cache = None
+    if not args.no_cache:
+        cache = RenderCache(args.cache_dir, args.cache_max_mb * 1024 * 1024, args.png_preset)
+    pngs, encode_times = render_png_bytes(
+        pixel_sizes, resample=args.resample, jobs=jobs, cache=cache, preset=args.png_preset,
+        threads=args.threads, plan_sizes=all_sizes)
+
+    current_label = None
+    total_bytes = 0
+    for label, filepath, pixel_size in stale:
+        if label != current_label:
+            print(f"\nGenerating {label} icons...")
+            current_label = label
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        filename = os.path.basename(filepath)
+        data = stamp_png(pngs[pixel_size], stamp)
+        encoded = f"{encode_times[pixel_size] * 1000:.1f} ms" if pixel_size in encode_times else "cached"
+        report = f"({pixel_size}x{pixel_size}, {len(data) / 1024:.1f} KiB, {encoded})"
+        total_bytes += len(data)
+        if write_if_changed(filepath, data):
+            print(f"  Created: {filename} {report}")
+        else:
+            print(f"  Unchanged: {filename} {report}")
 
-    print(f"watchOS icons saved to: {base_path}")
+    encode_total = sum(encode_times.values())
+    print(f"\nEncoded {len(encode_times)} sizes in {encode_total:.2f}s (summed); "
+          f"{total_bytes / 1024:.1f} KiB written across {len(stale)} outputs")
+
+
+def generate_print_icons(docs_path, sizes, band_height, compress_level, force, source_mtime, stamp):
+    """Stream print-size renders band by band into PNG files.
+
+    Each file is written next to its target and moved into place, so an
+    interrupted render never leaves a partial PNG behind.
+    """
+    print("\nGenerating print icons...")
+    os.makedirs(docs_path, exist_ok=True)
+    for size in sizes:
+        filename = f"zoe-sleep-icon-{size}.png"
+        filepath = os.path.join(docs_path, filename)
+        if not force and not is_stale(filepath, size, source_mtime, stamp):
+            print(f"  Up to date: {filename}")
+            continue
+        start = time.perf_counter()
+        temp_file = filepath + '.tmp'
+        with open(temp_file, 'wb') as f:
+            write_png_stream(f, size, size, iter_icon_bands(size, band_height), compress_level, stamp)
+        os.replace(temp_file, filepath)
+        elapsed = time.perf_counter() - start
+        print(f"  Created: {filename} ({size}x{size}, {os.path.getsize(filepath) / 1024:.1f} KiB, {elapsed:.1f}s)")
 
 
 def main():
-    import os
+    parser = argparse.ArgumentParser(description="Generate Zoe Sleep app icons")
+    parser.add_argument('--resample', action='store_true',
+                        help="render one master per detail tier and downsample the other sizes from it")
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help="number of worker processes to render with (0 = one per CPU core)")
+    parser.add_argument('--threads', type=int, default=1, metavar='N',
+                        help="threads that share each single icon render, split by row bands")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f"render cache location (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument('--cache-max-mb', type=int, default=DEFAULT_CACHE_MAX_BYTES // (1024 * 1024),
+                        help="evict least recently used cache entries beyond this size")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always re-render, ignoring and not updating the cache")
+    parser.add_argument('--png-preset', choices=list(PNG_PRESETS), default='default',
+                        help="PNG encoder settings, from fastest encode to smallest file (default: default)")
+    parser.add_argument('--print-sizes', type=lambda value: [int(size) for size in value.split(',')], default=[],
+                        metavar='SIZES',
+                        help="comma-separated print sizes (e.g. 4096,8192) rendered in bands into docs/")
+    parser.add_argument('--band-height', type=int, default=None, metavar='ROWS',
+                        help=f"rows per band for print renders (default: as many as fit {BAND_PIXEL_BUDGET} pixels)")
+    parser.add_argument('--force', action='store_true',
+                        help="rebuild every output, not just missing or stale ones")
+    parser.add_argument('--watch', action='store_true',
+                        help="keep running and re-render the changed layers of the preview on every save")
+    args = parser.parse_args()
+    jobs = args.jobs or os.cpu_count() or 1
 
-    # Paths to asset catalogs
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)
-
-    ios_icon_path = os.path.join(project_root, 'Sleep360', 'Sleep360', 'Assets.xcassets', 'AppIcon.appiconset')
-    watch_icon_path = os.path.join(project_root, 'Sleep360', 'Sleep360 Watch App', 'Assets.xcassets', 'AppIcon.appiconset')
+    source_mtime = os.path.getmtime(os.path.abspath(__file__))
 
     print("=" * 60)
     print("Zoe Sleep App Icon Generator - Circadian Wave Design")
@@ -297,56 +1126,40 @@ def main():
     print("Colors: Deep navy to teal gradient with glowing wave accents")
     print("Theme: Sleep cycles, longevity, natural rhythm (NO moon/stars)")
     print()
-    print(f"iOS path: {ios_icon_path}")
-    print(f"watchOS path: {watch_icon_path}")
-    print()
-
-    # Ensure directories exist
-    os.makedirs(ios_icon_path, exist_ok=True)
-    os.makedirs(watch_icon_path, exist_ok=True)
 
-    # Generate icons
-    generate_ios_icons(ios_icon_path)
-    generate_watchos_icons(watch_icon_path)
+    if args.watch:
+        preview_name, preview_size = DOCS_ICON_SIZES[0]
+        watch(os.path.abspath(__file__), os.path.join(project_root, 'docs', preview_name), preview_size)
+        return
+
+    # Work out which outputs are missing, stale or built with other settings
+    stamp = build_stamp(resample=args.resample, png_preset=args.png_preset)
+    targets = build_targets(project_root)
+    stale = []
+    all_sizes = []
+    for label, directory, entries in targets:
+        for filename, _, _, pixel_size in entries:
+            all_sizes.append(pixel_size)
+            filepath = os.path.join(directory, filename)
+            if args.force or is_stale(filepath, pixel_size, source_mtime, stamp):
+                stale.append((label, filepath, pixel_size))
+
+    print(f"{len(stale)} of {len(all_sizes)} outputs need rebuilding")
+    if stale:
+        generate_icons(stale, args, jobs, all_sizes, stamp)
+    else:
+        print("Everything is up to date.")
+
+    if args.print_sizes:
+        compress_level = PNG_PRESETS[args.png_preset][0].get('compress_level', 9)
+        generate_print_icons(os.path.join(project_root, 'docs'), args.print_sizes,
+                             args.band_height, compress_level, args.force, source_mtime,
+                             build_stamp(png_preset=args.png_preset))
 
     print("\n" + "=" * 60)
     print("Icon generation complete!")
     print("=" * 60)
 
-    # Also save a preview at 512x512 for easy viewing
-    docs_path = os.path.join(project_root, 'docs')
-    os.makedirs(docs_path, exist_ok=True)
-
-    preview_path = os.path.join(docs_path, 'zoe-sleep-icon-preview.png')
-    preview = create_zoe_sleep_icon(512)
-    preview.save(preview_path, 'PNG')
-    print(f"\nPreview saved to: {preview_path}")
-
-    # Also save a large version for marketing
-    marketing_path = os.path.join(docs_path, 'zoe-sleep-icon-1024.png')
-    marketing = create_zoe_sleep_icon(1024)
-    marketing.save(marketing_path, 'PNG')
-    print(f"Marketing icon saved to: {marketing_path}")
-
-    # Generate Launch Screen Icons
-    launch_icon_path = os.path.join(project_root, 'Sleep360', 'Sleep360', 'Assets.xcassets', 'LaunchIcon.imageset')
-    os.makedirs(launch_icon_path, exist_ok=True)
-
-    print("\nGenerating Launch Screen icons...")
-    launch_sizes = [
-        ('LaunchIcon.png', 200),
-        ('LaunchIcon@2x.png', 400),
-        ('LaunchIcon@3x.png', 600),
-    ]
-
-    for filename, pixel_size in launch_sizes:
-        icon = create_zoe_sleep_icon(pixel_size)
-        filepath = os.path.join(launch_icon_path, filename)
-        icon.save(filepath, 'PNG')
-        print(f"  Created: {filename} ({pixel_size}x{pixel_size})")
-
-    print(f"Launch icons saved to: {launch_icon_path}")
-
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,125 @@
+"""
+Local SQLite cache of Linear issues for incremental syncs.
+
+Issues are stored as JSON keyed by id, with indexes on updatedAt and parent.
+Each project keeps a watermark (the newest updatedAt seen), so a sync only
+asks Linear for issues changed since the previous run.
+"""
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+from linear_issues import iter_project_issues
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "linear_cache.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    id TEXT PRIMARY KEY,
+    project_id TEXT NOT NULL,
+    identifier TEXT,
+    parent_id TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_project_updated ON issues (project_id, updated_at);
+CREATE INDEX IF NOT EXISTS issues_parent ON issues (parent_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project_id TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at TEXT
+);
+"""
+
+
+class IssueCache:
+    """SQLite-backed store of a project's issues and its sync watermark"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def watermark(self, project_id):
+        """Get the newest updatedAt synced for a project, or None"""
+        row = self.db.execute(
+            "SELECT watermark FROM sync_state WHERE project_id = ?", (project_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def upsert(self, project_id, issues):
+        """Insert or replace issues; returns (count, newest updatedAt seen).
+
+        issues may be a stream; rows are written as it is consumed.
+        """
+        stats = {"count": 0, "newest": None}
+
+        def rows():
+            for issue in issues:
+                updated_at = issue.get("updatedAt")
+                if updated_at and (stats["newest"] is None or updated_at > stats["newest"]):
+                    stats["newest"] = updated_at
+                stats["count"] += 1
+                yield (
+                    issue["id"],
+                    project_id,
+                    issue.get("identifier"),
+                    (issue.get("parent") or {}).get("id"),
+                    updated_at,
+                    json.dumps(issue, ensure_ascii=False)
+                )
+
+        # Updating in place keeps each issue's rowid, and with it the
+        # original fetch order that iter_issues returns
+        self.db.executemany(
+            "INSERT INTO issues (id, project_id, identifier, parent_id, updated_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET project_id = excluded.project_id, "
+            "identifier = excluded.identifier, parent_id = excluded.parent_id, "
+            "updated_at = excluded.updated_at, data = excluded.data",
+            rows()
+        )
+        return stats["count"], stats["newest"]
+
+    def iter_issues(self, project_id):
+        """Yield a project's cached issues in the order they were first fetched"""
+        cursor = self.db.execute(
+            "SELECT data FROM issues WHERE project_id = ? ORDER BY rowid", (project_id,)
+        )
+        for (data,) in cursor:
+            yield json.loads(data)
+
+    def clear(self, project_id):
+        """Forget a project's issues and watermark (within the caller's transaction)"""
+        self.db.execute("DELETE FROM issues WHERE project_id = ?", (project_id,))
+        self.db.execute("DELETE FROM sync_state WHERE project_id = ?", (project_id,))
+
+
+def sync_project_issues(client, cache, project_id, page_size=None, full=False):
+    """Bring the cache up to date with Linear; returns the number of issues fetched.
+
+    Only issues updated at or after the stored watermark are requested.
+    The boundary is inclusive so issues sharing the watermark's timestamp
+    are never missed; re-fetching them is harmless. Pages are written as
+    they arrive but committed, along with the new watermark, only once the
+    whole sync succeeds. full=True replaces the project's cached issues
+    with a fresh copy of everything, which also clears out issues since
+    deleted or moved to another project.
+    """
+    with cache.db:
+        if full:
+            cache.clear(project_id)
+        watermark = cache.watermark(project_id)
+        fetched, newest = cache.upsert(
+            project_id, iter_project_issues(client, project_id, page_size, updated_since=watermark)
+        )
+        cache.db.execute(
+            "INSERT OR REPLACE INTO sync_state (project_id, watermark, synced_at) VALUES (?, ?, ?)",
+            (project_id, max(filter(None, [watermark, newest]), default=None), datetime.now().isoformat())
+        )
+    return fetched
@@ -0,0 +1,325 @@
+"""
+Streaming access to Linear projects and their issues, plus the viewer and
+team queries the scripts share.
+
+Projects are paged through with Linear's cursor pagination instead of being
+fetched as one response, so large workspaces stay under the GraphQL
+complexity limit and issues can be processed as they arrive.
+"""
+import os
+import re
+
+# Issues requested per page; override with LINEAR_PAGE_SIZE
+DEFAULT_PAGE_SIZE = 100
+
+# Linear's complexity model: 0.1 per scalar field, 1 per object, and a
+# connection's nodes count once per item it may return (50 when unpaged).
+# Queries above MAX_QUERY_COMPLEXITY are rejected outright.
+MAX_QUERY_COMPLEXITY = 10000
+DEFAULT_CONNECTION_SIZE = 50
+
+# Every issue field the exports use, as dotted paths
+ISSUE_FIELD_PATHS = (
+    "id",
+    "identifier",
+    "title",
+    "description",
+    "priority",
+    "createdAt",
+    "updatedAt",
+    "state.id",
+    "state.name",
+    "state.type",
+    "assignee.id",
+    "assignee.name",
+    "assignee.email",
+    "creator.id",
+    "creator.name",
+    "creator.email",
+    "parent.id",
+    "parent.identifier",
+    "parent.title",
+    "children.nodes.id",
+    "children.nodes.identifier",
+    "children.nodes.title",
+)
+
+
+def field_tree(fields):
+    """Turn dotted field paths into a nested {name: {subfields}} dict"""
+    tree = {}
+    for path in fields:
+        node = tree
+        for name in path.split("."):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def build_selection(fields, indent=12):
+    """Build the GraphQL selection for a list of dotted field paths.
+
+    ["id", "state.name", "children.nodes.identifier"] selects id,
+    state { name } and children { nodes { identifier } }, with fields in
+    the order they are first named.
+    """
+    def render(tree, depth):
+        pad = " " * depth
+        lines = []
+        for name, subfields in tree.items():
+            if subfields:
+                lines.append(f"{pad}{name} {{")
+                lines.extend(render(subfields, depth + 4))
+                lines.append(f"{pad}}}")
+            else:
+                lines.append(f"{pad}{name}")
+        return lines
+
+    return "\n".join(render(field_tree(fields), indent))
+
+
+def selection_complexity(tree):
+    """Estimate one object's complexity under Linear's model"""
+    cost = 0.0
+    for subfields in tree.values():
+        if not subfields:
+            cost += 0.1
+        elif "nodes" in subfields:
+            cost += 1 + DEFAULT_CONNECTION_SIZE * selection_complexity(subfields["nodes"])
+        else:
+            cost += 1 + selection_complexity(subfields)
+    return cost
+
+
+def estimate_issues_complexity(fields, page_size):
+    """Estimate the complexity of one page of project_issues_query(fields)"""
+    # The issues connection, plus pageInfo with its two scalars
+    return 1 + page_size * selection_complexity(field_tree(fields)) + 1.2
+
+
+VIEWER_QUERY = """
+query {
+    viewer {
+        id
+        name
+        email
+    }
+}
+"""
+
+WORKFLOW_STATES_QUERY = """
+query($teamKey: String!) {
+    team(key: $teamKey) {
+        states {
+            nodes {
+                id
+                name
+                type
+            }
+        }
+    }
+}
+"""
+
+PROJECT_QUERY = """
+query($name: String!) {
+    projects(filter: { name: { eq: $name } }, first: 1) {
+        nodes {
+            id
+            name
+            description
+            state
+            progress
+        }
+    }
+}
+"""
+
+ISSUES_PAGE_QUERY = """
+query($filter: IssueFilter!, $first: Int!, $after: String) {
+    issues(filter: $filter, first: $first, after: $after) {
+        nodes {
+%s
+        }
+        pageInfo {
+            hasNextPage
+            endCursor
+        }
+    }
+}
+"""
+
+_issues_queries = {}
+
+
+def project_issues_query(fields=ISSUE_FIELD_PATHS):
+    """Get the paged issues query selecting only the given fields.
+
+    The text is built once per field list, so repeated pages send an
+    identical document (which keeps rate-limit cost tracking per query).
+    """
+    fields = tuple(fields)
+    if fields not in _issues_queries:
+        _issues_queries[fields] = ISSUES_PAGE_QUERY % build_selection(fields)
+    return _issues_queries[fields]
+
+
+def page_size_setting():
+    """Return the configured issues-per-page (LINEAR_PAGE_SIZE)"""
+    return int(os.getenv("LINEAR_PAGE_SIZE", DEFAULT_PAGE_SIZE))
+
+
+def get_project(client, project_name):
+    """Get a project's details (without its issues) by name"""
+    result = client.query(PROJECT_QUERY, {"name": project_name})
+    nodes = result.get("data", {}).get("projects", {}).get("nodes", [])
+    return nodes[0] if nodes else None
+
+
+def identifier_filter(identifiers):
+    """Build an IssueFilter matching issues by identifier, e.g. "SLE-225"
+
+    Linear filters on team key and issue number rather than on the
+    identifier itself, so the identifiers are grouped by team.
+    """
+    numbers = {}
+    for identifier in identifiers:
+        team_key, number = identifier.rsplit("-", 1)
+        numbers.setdefault(team_key, []).append(int(number))
+    clauses = [{"team": {"key": {"eq": key}}, "number": {"in": team_numbers}}
+               for key, team_numbers in numbers.items()]
+    return clauses[0] if len(clauses) == 1 else {"or": clauses}
+
+
+def project_issues_request(project_id, page_size=None, updated_since=None, fields=ISSUE_FIELD_PATHS,
+                           identifiers=None):
+    """Build (query, first-page variables, estimated complexity) for a project's issues.
+
+    identifiers optionally limits the request to those issues, filtered on
+    Linear's side. The page size is lowered if needed so the estimated
+    complexity stays within MAX_QUERY_COMPLEXITY.
+    """
+    page_size = page_size or page_size_setting()
+    per_issue = selection_complexity(field_tree(fields))
+    fitting = int((MAX_QUERY_COMPLEXITY - estimate_issues_complexity(fields, 0)) // per_issue)
+    page_size = max(1, min(page_size, fitting))
+
+    issue_filter = {"project": {"id": {"eq": project_id}}}
+    if updated_since:
+        issue_filter["updatedAt"] = {"gte": updated_since}
+    if identifiers:
+        issue_filter.update(identifier_filter(identifiers))
+    variables = {
+        "filter": issue_filter,
+        "first": page_size,
+        "after": None
+    }
+    return project_issues_query(fields), variables, estimate_issues_complexity(fields, page_size)
+
+
+def expect_complexity(client, query, complexity):
+    """Let a rate-limited client pace query by its estimated cost until Linear reports the real one"""
+    budget = getattr(client, "budget", None)
+    if budget is not None:
+        budget.expect(query, complexity)
+
+
+def read_issues_page(result):
+    """Split a project_issues_query result into (issues, cursor of the next page or None)"""
+    if result.get("errors"):
+        raise RuntimeError(f"Linear returned errors while paging issues: {result['errors']}")
+    connection = result.get("data", {}).get("issues", {})
+    page_info = connection.get("pageInfo", {})
+    next_cursor = page_info.get("endCursor") if page_info.get("hasNextPage") else None
+    return connection.get("nodes", []), next_cursor
+
+
+def iter_project_issues(client, project_id, page_size=None, updated_since=None, fields=ISSUE_FIELD_PATHS,
+                        identifiers=None):
+    """Yield every issue in a project, one page at a time.
+
+    Follows pageInfo.endCursor until Linear reports no further pages.
+    updated_since (an ISO timestamp) limits the stream to issues updated
+    at or after that time, and identifiers to the named issues. fields
+    (dotted paths, see ISSUE_FIELD_PATHS) limits what each issue carries;
+    callers that need a few fields should ask for just those. Raises
+    RuntimeError if a page comes back with GraphQL errors, rather than
+    silently ending the stream early.
+    """
+    query, variables, complexity = project_issues_request(project_id, page_size, updated_since, fields, identifiers)
+    expect_complexity(client, query, complexity)
+    while True:
+        issues, next_cursor = read_issues_page(client.query(query, variables))
+        yield from issues
+        if not next_cursor:
+            return
+        variables["after"] = next_cursor
+
+
+def index_issues(issues):
+    """Collect issues into lookup indexes in a single pass.
+
+    issues may be any iterable, including the iter_project_issues stream.
+    Returns (all_issues, by_identifier, children_by_parent) where
+    children_by_parent maps a parent's identifier to its child issues in
+    stream order.
+    """
+    all_issues = []
+    by_identifier = {}
+    children_by_parent = {}
+    for issue in issues:
+        all_issues.append(issue)
+        identifier = issue.get("identifier")
+        if identifier:
+            by_identifier[identifier] = issue
+        parent = issue.get("parent")
+        if parent and parent.get("identifier"):
+            children_by_parent.setdefault(parent["identifier"], []).append(issue)
+    return all_issues, by_identifier, children_by_parent
+
+
+def component_prefix(component_title):
+    """Get the prefix that marks a component's issues.
+
+    "Component 1: Title" gives "Component 1"; titles without a colon fall
+    back to a leading "Component N". Returns None if neither is present.
+    """
+    if ":" in component_title:
+        return component_title.split(":")[0].strip() or None
+    match = re.match(r"(Component\s+\d+)", component_title)
+    return match.group(1) if match else None
+
+
+def partition_issues_by_component(issues, components):
+    """Assign issues to components by title prefix in a single pass.
+
+    An issue belongs to a component when the component's prefix appears as
+    a whole token in the issue's title or its parent's title, so
+    "Component 1" does not claim "Component 10" issues. All prefixes are
+    compiled into one pattern up front. Returns {component identifier:
+    [issues]} with every component present, issues in input order, and
+    each issue listed at most once per component.
+    """
+    components_by_prefix = {}
+    for component in components:
+        prefix = component_prefix(component.get("title") or "")
+        if prefix:
+            components_by_prefix.setdefault(prefix, []).append(component.get("identifier"))
+
+    partitions = {component.get("identifier"): [] for component in components}
+    if not components_by_prefix:
+        return partitions
+
+    # Longest first so a prefix never shadows a longer one it starts with
+    alternatives = sorted(components_by_prefix, key=len, reverse=True)
+    pattern = re.compile(r"(?<!\w)(?:%s)(?!\w)" % "|".join(map(re.escape, alternatives)))
+
+    for issue in issues:
+        parent = issue.get("parent") or {}
+        text = f"{issue.get('title') or ''}\n{parent.get('title') or ''}"
+        matched = set()
+        for prefix in pattern.findall(text):
+            for identifier in components_by_prefix[prefix]:
+                if identifier not in matched:
+                    matched.add(identifier)
+                    partitions[identifier].append(issue)
+    return partitions
@@ -0,0 +1,159 @@
+"""
+Persistent on-disk cache for slow-changing Linear query results.
+
+Entries are keyed by the API key, the query text and its variables, and are
+grouped by kind (the query's root fields, e.g. "viewer" or "team"). Each
+kind has its own time-to-live; kinds without one are never cached, so issue
+data is always fetched fresh. Mutations drop the kinds they can affect.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "zoe-linear")
+DEFAULT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+HOUR = 60 * 60
+
+# Seconds each kind of result stays fresh
+DEFAULT_TTLS = {
+    "viewer": 24 * HOUR,
+    "team": 24 * HOUR,                # workflow states
+    "parent_categories": 6 * HOUR,    # LinearClient.get_parent_categories
+}
+
+ISSUE_KINDS = {"issue", "issues", "project", "projects", "parent_categories"}
+
+# Kinds each mutation can make stale; mutations not listed clear everything
+MUTATION_INVALIDATES = {
+    "issueUpdate": ISSUE_KINDS,
+    "issueCreate": ISSUE_KINDS,
+    "issueDelete": ISSUE_KINDS,
+    "issueArchive": ISSUE_KINDS,
+    "workflowStateCreate": {"team"},
+    "workflowStateUpdate": {"team"},
+    "workflowStateArchive": {"team"},
+    "userUpdate": {"viewer"},
+}
+
+
+def _remove(path):
+    # Another process or thread may have dropped the entry already
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+_TOKEN = re.compile(r'"(?:\\.|[^"\\])*"|[A-Za-z_]\w*|[{}():]')
+
+
+def parse_operation(document):
+    """Return (operation, root fields) for a GraphQL document.
+
+    operation is "query" or "mutation"; aliases are resolved to the field
+    they name, so "u0: issueUpdate(...)" gives "issueUpdate".
+    """
+    tokens = _TOKEN.findall(document)
+    operation = "mutation" if tokens and tokens[0] == "mutation" else "query"
+    fields = []
+    braces = parens = 0
+    for i, token in enumerate(tokens):
+        if token == "{":
+            braces += 1
+        elif token == "}":
+            braces -= 1
+        elif token == "(":
+            parens += 1
+        elif token == ")":
+            parens -= 1
+        elif braces == 1 and parens == 0 and token[0] != '"' and token != ":":
+            is_alias = i + 1 < len(tokens) and tokens[i + 1] == ":"
+            if not is_alias and token not in fields:
+                fields.append(token)
+    return operation, fields
+
+
+class QueryCache:
+    """Size-bounded, TTL-aware on-disk cache of query results.
+
+    One JSON file per entry, named after its kind so a kind can be dropped
+    without reading every entry. Hits refresh the file's mtime and the
+    least recently used entries are evicted once the cache grows past
+    max_bytes.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_MAX_BYTES, ttls=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, kind, key):
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{kind}-{digest}.json")
+
+    def get(self, kind, key):
+        """Return the cached value, or None if missing or older than its TTL"""
+        ttl = self.ttls.get(kind)
+        if not ttl:
+            return None
+        path = self._path(kind, key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            if time.time() - entry["stored_at"] > ttl:
+                return None
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry["value"]
+
+    def put(self, kind, key, value):
+        """Store a value if its kind is cacheable"""
+        if not self.ttls.get(kind):
+            return
+        path = self._path(kind, key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"stored_at": time.time(), "value": value}, f)
+        os.replace(temp_path, path)
+        self.evict()
+
+    def invalidate(self, kinds=None):
+        """Drop every entry of the given kinds, or everything if kinds is None"""
+        for entry in os.scandir(self.cache_dir):
+            kind = entry.name.rsplit("-", 1)[0]
+            if entry.name.endswith(".json") and (kinds is None or kind in kinds):
+                _remove(entry.path)
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+    def invalidate_for_mutation(self, fields):
+        """Drop the kinds a mutation with these root fields can change"""
+        kinds = set()
+        for field in fields:
+            if field not in MUTATION_INVALIDATES:
+                self.invalidate()
+                return
+            kinds |= MUTATION_INVALIDATES[field]
+        self.invalidate(kinds)
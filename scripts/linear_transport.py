@@ -0,0 +1,194 @@
+"""
+Pooled, retrying transport for Linear's GraphQL API.
+
+PooledLinearClient keeps one keep-alive session for every query, retries
+rate-limited and transient failures with jittered exponential backoff, and
+reads Linear's rate-limit headers so bulk runs slow down before they run
+out of budget instead of failing halfway.
+"""
+import hashlib
+import random
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from linear_client import LinearClient
+from linear_query_cache import parse_operation
+
+LINEAR_API_URL = "https://api.linear.app/graphql"
+
+# Responses worth another attempt; Linear also reports rate limiting as a
+# 400 with a RATELIMITED error code
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Below this share of either budget, requests are spread evenly over the
+# time left until the budget resets
+LOW_BUDGET_FRACTION = 0.1
+
+
+def _header_int(headers, name):
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RateLimitBudget:
+    """Linear's request and complexity budgets, as last reported by the API"""
+
+    def __init__(self):
+        self.requests = None      # (remaining, limit, reset epoch seconds)
+        self.complexity = None
+        self.query_costs = {}     # query text -> complexity of its last run
+
+    def update(self, headers, query):
+        """Record the budgets from a response's X-RateLimit-* headers"""
+        for attr, kind in (("requests", "Requests"), ("complexity", "Complexity")):
+            remaining = _header_int(headers, f"X-RateLimit-{kind}-Remaining")
+            limit = _header_int(headers, f"X-RateLimit-{kind}-Limit")
+            reset = _header_int(headers, f"X-RateLimit-{kind}-Reset")
+            if remaining is not None and limit is not None and reset is not None:
+                setattr(self, attr, (remaining, limit, reset / 1000))
+        cost = _header_int(headers, "X-Complexity")
+        if cost is not None:
+            self.query_costs[query] = cost
+
+    def expect(self, query, cost):
+        """Use an estimated cost for query until the API reports its real one"""
+        self.query_costs.setdefault(query, cost)
+
+    def delay(self, query, now=None):
+        """Seconds to wait before sending query so neither budget runs dry"""
+        now = time.time() if now is None else now
+        cost = self.query_costs.get(query, 1)
+        waits = []
+        for budget, needed in ((self.requests, 1), (self.complexity, cost)):
+            if budget is None:
+                continue
+            remaining, limit, reset = budget
+            until_reset = max(0.0, reset - now)
+            if remaining < needed:
+                waits.append(until_reset)
+            elif remaining < limit * LOW_BUDGET_FRACTION:
+                waits.append(until_reset * needed / remaining)
+        return max(waits, default=0.0)
+
+
+class PooledLinearClient(LinearClient):
+    """LinearClient whose queries share a pooled session and retry on failure.
+
+    With a QueryCache, slow-changing results (viewer, workflow states,
+    component list) are served from disk until their TTL runs out, and
+    mutations drop the entries they can affect. bypass_cache skips cache
+    reads but still stores fresh results, so a bypassed run also refreshes
+    the cache.
+    """
+
+    def __init__(self, api_key, max_retries=5, backoff=0.5, max_backoff=30.0, timeout=30.0, pool_size=10,
+                 cache=None, bypass_cache=False):
+        super().__init__(api_key)
+        self.cache = cache
+        self.bypass_cache = bypass_cache
+        # Results differ per workspace and user, so entries are keyed on the key's hash
+        self.cache_namespace = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.budget = RateLimitBudget()
+
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+        self.session.headers.update({
+            "Authorization": api_key,
+            "Content-Type": "application/json"
+        })
+
+    def retry_delay(self, attempt, response=None):
+        """Full-jitter exponential backoff, or the server's Retry-After if given"""
+        retry_after = _header_int(response.headers, "Retry-After") if response is not None else None
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def query(self, query, variables=None):
+        """Run a GraphQL query and return the decoded response body"""
+        if not self.cache:
+            return self._send(query, variables)
+
+        operation, fields = parse_operation(query)
+        if operation == "mutation":
+            result = self._send(query, variables)
+            self.cache.invalidate_for_mutation(fields)
+            return result
+
+        kind = "+".join(fields)
+        key = [self.cache_namespace, query, variables or {}]
+        if not self.bypass_cache:
+            cached = self.cache.get(kind, key)
+            if cached is not None:
+                return cached
+        result = self._send(query, variables)
+        if not result.get("errors"):
+            self.cache.put(kind, key, result)
+        return result
+
+    def get_parent_categories(self, project_name):
+        """Get a project's parent categories, through the cache when there is one"""
+        if not self.cache:
+            return super().get_parent_categories(project_name)
+        key = [self.cache_namespace, project_name]
+        if not self.bypass_cache:
+            cached = self.cache.get("parent_categories", key)
+            if cached is not None:
+                return cached
+        categories = super().get_parent_categories(project_name)
+        self.cache.put("parent_categories", key, categories)
+        return categories
+
+    def _send(self, query, variables=None):
+        payload = {"query": query, "variables": variables or {}}
+        for attempt in range(self.max_retries + 1):
+            wait = self.budget.delay(query)
+            if wait > 0:
+                time.sleep(wait)
+
+            try:
+                response = self.session.post(LINEAR_API_URL, json=payload, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.retry_delay(attempt)
+                print(f"   ⚠ Linear request failed ({e.__class__.__name__}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            self.budget.update(response.headers, query)
+            if not self._should_retry(response):
+                if response.status_code >= 400 and not self._has_graphql_body(response):
+                    response.raise_for_status()
+                return response.json()
+
+            if attempt == self.max_retries:
+                response.raise_for_status()
+            delay = self.retry_delay(attempt, response)
+            print(f"   ⚠ Linear returned {response.status_code}; retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+    @staticmethod
+    def _has_graphql_body(response):
+        try:
+            return isinstance(response.json(), dict)
+        except ValueError:
+            return False
+
+    @classmethod
+    def _should_retry(cls, response):
+        if response.status_code in RETRY_STATUSES:
+            return True
+        if response.status_code == 400 and cls._has_graphql_body(response):
+            errors = response.json().get("errors") or []
+            return any((error.get("extensions") or {}).get("code") == "RATELIMITED" for error in errors)
+        return False
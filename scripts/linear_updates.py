@@ -0,0 +1,79 @@
+"""
+Bulk issue updates for Linear.
+
+Many issueUpdate operations are sent as one GraphQL mutation document, each
+under its own alias, so updating hundreds of issues takes a handful of
+requests instead of one round trip per change.
+"""
+
+# issueUpdate operations per mutation document
+DEFAULT_CHUNK_SIZE = 50
+
+UPDATED_ISSUE_FIELDS = """
+            success
+            issue {
+                id
+                identifier
+                title
+                assignee {
+                    name
+                    email
+                }
+                state {
+                    name
+                    type
+                }
+            }
+"""
+
+
+def build_update_mutation(count):
+    """Build a mutation document with count aliased issueUpdate operations"""
+    parameters = ", ".join(f"$id{i}: String!, $input{i}: IssueUpdateInput!" for i in range(count))
+    operations = "".join(
+        f"\n        u{i}: issueUpdate(id: $id{i}, input: $input{i}) {{{UPDATED_ISSUE_FIELDS}        }}"
+        for i in range(count)
+    )
+    return f"mutation({parameters}) {{{operations}\n}}"
+
+
+def bulk_update_issues(client, updates, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Apply many issue updates using one aliased mutation per chunk.
+
+    updates is a list of (issue_id, input) pairs where input is an
+    IssueUpdateInput dict such as {"assigneeId": ..., "stateId": ...};
+    combine changes to the same issue into one input. Returns
+    {issue_id: {"success", "issue", "error"}} in the order given. A failed
+    operation does not affect the others in its chunk, and a chunk whose
+    request fails outright marks only its own issues as failed.
+    """
+    results = {}
+    for start in range(0, len(updates), chunk_size):
+        chunk = updates[start:start + chunk_size]
+        variables = {}
+        for i, (issue_id, update_input) in enumerate(chunk):
+            variables[f"id{i}"] = issue_id
+            variables[f"input{i}"] = update_input
+
+        try:
+            result = client.query(build_update_mutation(len(chunk)), variables)
+        except Exception as e:
+            for issue_id, _ in chunk:
+                results[issue_id] = {"success": False, "issue": None, "error": str(e)}
+            continue
+
+        data = result.get("data") or {}
+        errors = {}
+        for error in result.get("errors") or []:
+            path = error.get("path") or [None]
+            errors.setdefault(path[0], error.get("message", "Unknown error"))
+
+        for i, (issue_id, _) in enumerate(chunk):
+            alias = f"u{i}"
+            payload = data.get(alias) or {}
+            success = bool(payload.get("success"))
+            error = errors.get(alias)
+            if not success and not error:
+                error = errors.get(None, "Update was not applied")
+            results[issue_id] = {"success": success, "issue": payload.get("issue"), "error": error}
+    return results
@@ -4,91 +4,28 @@ Plan and update Linear tasks for SLE-225 (Supporting Systems)
 """
 import sys
 import os
+import argparse
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from linear_client import LinearClient
+from linear_transport import PooledLinearClient
+from linear_query_cache import QueryCache
+from linear_issues import VIEWER_QUERY, WORKFLOW_STATES_QUERY, get_project, iter_project_issues
+from linear_updates import bulk_update_issues
+
+# The only issue fields the plan reads
+PLAN_ISSUE_FIELDS = ["id", "identifier", "title", "state.name", "assignee.name", "parent.identifier"]
 
 def get_viewer_info(client):
     """Get current user (viewer) information"""
-    query = """
-    query {
-        viewer {
-            id
-            name
-            email
-        }
-    }
-    """
-    result = client.query(query)
+    result = client.query(VIEWER_QUERY)
     return result.get("data", {}).get("viewer", {})
 
-def assign_issue(client, issue_id, user_id):
-    """Assign an issue to a user"""
-    mutation = """
-    mutation($issueId: String!, $userId: String!) {
-        issueUpdate(id: $issueId, input: { assigneeId: $userId }) {
-            success
-            issue {
-                id
-                identifier
-                title
-                assignee {
-                    name
-                    email
-                }
-            }
-        }
-    }
-    """
-    variables = {
-        "issueId": issue_id,
-        "userId": user_id
-    }
-    return client.query(mutation, variables)
-
-def update_issue_state(client, issue_id, state_id):
-    """Update issue state (e.g., move to In Progress)"""
-    mutation = """
-    mutation($issueId: String!, $stateId: String!) {
-        issueUpdate(id: $issueId, input: { stateId: $stateId }) {
-            success
-            issue {
-                id
-                identifier
-                title
-                state {
-                    name
-                    type
-                }
-            }
-        }
-    }
-    """
-    variables = {
-        "issueId": issue_id,
-        "stateId": state_id
-    }
-    return client.query(mutation, variables)
-
 def get_workflow_states(client, team_key="SLE"):
     """Get workflow states for a team"""
     try:
-        query = """
-        query($teamKey: String!) {
-            team(key: $teamKey) {
-                states {
-                    nodes {
-                        id
-                        name
-                        type
-                    }
-                }
-            }
-        }
-        """
         variables = {"teamKey": team_key}
-        result = client.query(query, variables)
+        result = client.query(WORKFLOW_STATES_QUERY, variables)
         return result.get("data", {}).get("team", {}).get("states", {}).get("nodes", [])
     except Exception as e:
         print(f"   ⚠ Could not fetch workflow states: {e}")
@@ -135,10 +72,14 @@ def get_issue_by_identifier(client, identifier):
     result = client.query(query, variables)
     return result.get("data", {}).get("issue")
 
-def plan_and_update_sle225():
-    """Plan SLE-225 work and update Linear tasks"""
+def plan_and_update_sle225(refresh=False):
+    """Plan SLE-225 work and update Linear tasks
+
+    The viewer and workflow states come from the query cache unless
+    refresh is set.
+    """
     api_key = os.getenv("LINEAR_API_KEY", "your-linear-api-key-here")
-    client = LinearClient(api_key)
+    client = PooledLinearClient(api_key, cache=QueryCache(), bypass_cache=refresh)
     
     print("="*80)
     print("SLE-225: Supporting Systems - Planning & Task Assignment")
@@ -173,16 +114,23 @@ def plan_and_update_sle225():
     # Get SLE-225 and its tasks using the existing working method
     print("\n3. Fetching SLE-225 component and tasks...")
     try:
-        # Use the existing method that works
-        project = client.get_project_with_issues("ZOE scope")
-        all_issues = project.get("issues", [])
+        project = get_project(client, "ZOE scope")
+        if not project:
+            print("ERROR: Could not find project 'ZOE scope'")
+            return
         
-        # Find SLE-225 component
+        # Ask Linear for just SLE-225 and its tasks
         component_issue = None
-        for issue in all_issues:
+        tasks = []
+        task_identifiers = ["SLE-226", "SLE-227", "SLE-228", "SLE-229"]
+        for issue in iter_project_issues(client, project["id"], fields=PLAN_ISSUE_FIELDS,
+                                         identifiers=["SLE-225", *task_identifiers]):
             if issue.get("identifier") == "SLE-225":
                 component_issue = issue
-                break
+            elif issue.get("identifier") in task_identifiers:
+                parent = issue.get("parent", {})
+                if parent and parent.get("identifier") == "SLE-225":
+                    tasks.append(issue)
         
         if not component_issue:
             print("ERROR: Could not find SLE-225")
@@ -192,15 +140,6 @@ def plan_and_update_sle225():
         print(f"   ✓ Current state: {component_issue['state']['name']}")
         print(f"   ✓ Current assignee: {component_issue['assignee']['name'] if component_issue.get('assignee') else 'Unassigned'}")
         
-        # Find all tasks under SLE-225
-        tasks = []
-        task_identifiers = ["SLE-226", "SLE-227", "SLE-228", "SLE-229"]
-        for issue in all_issues:
-            if issue.get("identifier") in task_identifiers:
-                parent = issue.get("parent", {})
-                if parent and parent.get("identifier") == "SLE-225":
-                    tasks.append(issue)
-        
         print(f"   ✓ Found {len(tasks)} tasks")
     except Exception as e:
         print(f"ERROR: Could not fetch SLE-225 data: {e}")
@@ -300,35 +239,42 @@ def plan_and_update_sle225():
         ("SLE-226", next((t for t in tasks if t['identifier'] == 'SLE-226'), None)),
     ]
     
+    # Collect every change first, folding assignment and state into one
+    # update per issue, then apply them in a single batched mutation
+    updates = []
+    planned = []
     for identifier, task_obj in tasks_to_assign:
         if not task_obj:
             print(f"   ⚠ {identifier}: Not found")
             continue
         
-        task_id = task_obj['id']
         current_assignee = task_obj.get('assignee', {}).get('name') if task_obj.get('assignee') else None
+        update_input = {}
         
         # Assign if not already assigned to us
         if current_assignee != user_name:
-            try:
-                result = assign_issue(client, task_id, user_id)
-                if result.get("data", {}).get("issueUpdate", {}).get("success"):
-                    print(f"   ✓ {identifier}: Assigned to {user_name}")
-                else:
-                    print(f"   ✗ {identifier}: Failed to assign")
-            except Exception as e:
-                print(f"   ✗ {identifier}: Error assigning - {e}")
+            update_input["assigneeId"] = user_id
         else:
             print(f"   ✓ {identifier}: Already assigned to {user_name}")
         
         # Update state to "In Progress" if available
         if in_progress_state and task_obj['state']['name'] == 'Backlog':
-            try:
-                result = update_issue_state(client, task_id, in_progress_state['id'])
-                if result.get("data", {}).get("issueUpdate", {}).get("success"):
-                    print(f"   ✓ {identifier}: Moved to '{in_progress_state['name']}'")
-            except Exception as e:
-                print(f"   ⚠ {identifier}: Could not update state - {e}")
+            update_input["stateId"] = in_progress_state['id']
+        
+        if update_input:
+            updates.append((task_obj['id'], update_input))
+            planned.append((identifier, task_obj['id'], update_input))
+    
+    results = bulk_update_issues(client, updates)
+    for identifier, task_id, update_input in planned:
+        outcome = results[task_id]
+        if not outcome["success"]:
+            print(f"   ✗ {identifier}: Update failed - {outcome['error']}")
+            continue
+        if "assigneeId" in update_input:
+            print(f"   ✓ {identifier}: Assigned to {user_name}")
+        if "stateId" in update_input:
+            print(f"   ✓ {identifier}: Moved to '{in_progress_state['name']}'")
     
     print("\n" + "="*80)
     print("SUMMARY")
@@ -339,5 +285,9 @@ def plan_and_update_sle225():
     print("="*80)
 
 if __name__ == "__main__":
-    plan_and_update_sle225()
+    parser = argparse.ArgumentParser(description="Plan SLE-225 and assign its tasks in Linear")
+    parser.add_argument("--refresh", action="store_true",
+                        help="re-query the viewer and workflow states instead of using the query cache")
+    args = parser.parse_args()
+    plan_and_update_sle225(refresh=args.refresh)
 